@@ -15,6 +15,14 @@ SPEC_ROOT = os.path.abspath(SPECPATH)
 if SPEC_ROOT not in sys.path:
     sys.path.insert(0, SPEC_ROOT)
 
+# Rebuild stale translation catalogs before bundling 'locale' so a build never ships
+# outdated .mo files. Languages whose .mo is newer than the .po are skipped.
+# Compiled serially: a process pool spawned from inside PyInstaller re-imports its
+# entry point in each worker on Windows, which can hang or recurse the build.
+from tools.compile_mo import main as compile_translations
+if not compile_translations(parallel=False):
+    raise SystemExit("Translation compile failed; fix the .po errors above and rebuild.")
+
 # Collect all submodules from the local utils package
 utils_imports = collect_submodules('utils')
 # Explicitly add utils.quick_whisper in case collect_submodules misses it
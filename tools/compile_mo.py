@@ -2,82 +2,185 @@
 """
 Compile .po files to .mo files without external dependencies.
 
-This script uses Python's built-in msgfmt module to compile translation files.
+The parser mirrors CPython's Tools/i18n/msgfmt.py, which is not importable
+from an installed Python, so it is implemented here rather than shelling out.
 """
 
+import ast
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Add the project root to the path so we can import msgfmt
+# Add the project root to the path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-# Python's tools/msgfmt.py from the standard library
-# We'll implement a simple version here
+# Header fields written to .mo files; see compile_po_to_mo
+MO_HEADER_FIELDS = ('Content-Type', 'Plural-Forms')
+
+# Classifies a .po line (as bytes) and captures its payload in one match. Keyword lines
+# end on the 'string' group (or 'keyword' when the string follows on the next line).
+_PO_LINE_RE = re.compile(
+    rb'^[ \t]*(?:'
+    rb'(?P<comment>#.*?)'
+    rb'|(?P<keyword>msgctxt|msgid_plural|msgid|msgstr(?:\[\d+\])?)(?:[ \t]+(?P<string>".*"))?'
+    rb'|(?P<cont>".*")'
+    rb'|(?P<blank>)'
+    rb'|(?P<bad>.+?)'
+    rb')[ \t]*\r?$',
+    re.MULTILINE,
+)
+
+def _unescape(quoted: bytes) -> str:
+    """Decode a quoted .po string (including its quotes) to text.
+
+    Only the payload is ever decoded; the rest of the file stays bytes. Most UI
+    strings have no escapes, so those skip the literal parser entirely.
+    """
+    if b'\\' not in quoted:
+        return quoted[1:-1].decode('utf-8')
+    # PO strings use C escapes, which Python string literals are a superset of
+    return ast.literal_eval(quoted.decode('utf-8'))
+
+
+def parse_po(po_path: Path) -> dict:
+    """Parse a .po file into a {msgid: msgstr} dict.
+
+    Follows the state machine of CPython's Tools/i18n/msgfmt.py: multi-line
+    strings, C escapes, msgctxt (keyed as "context\x04msgid"), plural forms
+    (msgid/msgstr variants joined with NUL) and skipping of fuzzy entries.
+    Untranslated entries are left out, as msgfmt does.
+    """
+    ID, STR, CTXT = 1, 2, 3
+
+    messages = {}
+    section = None
+    msgctxt = None
+    msgid = msgstr = ''
+    fuzzy = False
+    is_plural = False
+
+    def flush():
+        """Store the entry that just ended (if any) and reset the per-entry state."""
+        nonlocal section, msgctxt, fuzzy
+        if section != STR:
+            return
+        # Include the header too (empty msgid carries the charset info)
+        if not fuzzy and msgstr:
+            key = msgid if msgctxt is None else f"{msgctxt}\x04{msgid}"
+            previous = messages.get(key)
+            if previous is not None and previous != msgstr:
+                print(f"    Warning: {po_path}: duplicate msgid {msgid!r}, keeping the last translation")
+            messages[key] = msgstr
+        section = msgctxt = None
+        fuzzy = False
+
+    def error(match, message):
+        lno = data[:match.start()].count(b'\n') + 1
+        raise ValueError(f"{po_path}:{lno}: {message}")
+
+    # Scan the file in place through mmap rather than materialising it as lines
+    with open(po_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return messages
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # One regex pass classifies every line and captures its payload
+            for m in _PO_LINE_RE.finditer(data):
+                kind = m.lastgroup
+
+                if kind == 'cont':
+                    quoted = m.group('cont')
+                elif kind in ('comment', 'blank'):
+                    # A comment or blank line after a msgstr ends the entry
+                    flush()
+                    if kind == 'comment' and m.group('comment').startswith(b'#,') and b'fuzzy' in m.group('comment'):
+                        fuzzy = True
+                    continue
+                elif kind == 'bad':
+                    error(m, "expected a keyword, comment or quoted string")
+                else:
+                    keyword = m.group('keyword')
+                    quoted = m.group('string')
+                    if keyword == b'msgctxt':
+                        flush()
+                        section = CTXT
+                        msgctxt = ''
+                    elif keyword == b'msgid_plural':
+                        if section != ID:
+                            error(m, "msgid_plural not preceded by msgid")
+                        msgid += '\0'
+                        is_plural = True
+                    elif keyword == b'msgid':
+                        flush()
+                        section = ID
+                        msgid = msgstr = ''
+                        is_plural = False
+                    elif keyword == b'msgstr':
+                        if is_plural:
+                            error(m, "indexed msgstr required for plural")
+                        section = STR
+                    else:
+                        if not is_plural:
+                            error(m, "plural msgstr without msgid_plural")
+                        section = STR
+                        if msgstr:
+                            msgstr += '\0'
+                    if quoted is None:
+                        continue
+
+                value = _unescape(quoted)
+                if section == CTXT:
+                    msgctxt += value
+                elif section == ID:
+                    msgid += value
+                elif section == STR:
+                    msgstr += value
+                else:
+                    error(m, "string outside of an entry")
+
+    # Don't forget the last message
+    flush()
+
+    return messages
+
+
+def _hashpjw(data: bytes) -> int:
+    """GNU gettext's string hash (hash-string.c), used for the .mo hash table."""
+    hval = 0
+    for byte in data:
+        hval = ((hval << 4) + byte) & 0xFFFFFFFF
+        g = hval & 0xF0000000
+        if g:
+            hval ^= g >> 24
+            hval ^= g
+    return hval
+
+
+def _next_prime(n: int) -> int:
+    """Smallest odd prime >= n (n >= 3), as in GNU msgfmt's write-mo.c."""
+    n |= 1
+    while any(n % d == 0 for d in range(3, int(n ** 0.5) + 1, 2)):
+        n += 2
+    return n
+
 
 def compile_po_to_mo(po_path: Path, mo_path: Path) -> bool:
     """Compile a .po file to .mo format."""
     try:
         import struct
 
-        # Parse .po file
-        messages = {}
-        current_msgid = None
-        current_msgstr = None
-        in_msgid = False
-        in_msgstr = False
-
-        with open(po_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-
-            if line.startswith('msgid "'):
-                if current_msgid is not None and current_msgstr is not None:
-                    # Include ALL messages including header (empty msgid has charset info)
-                    messages[current_msgid] = current_msgstr
-                current_msgid = line[7:-1]  # Remove 'msgid "' and trailing '"'
-                current_msgstr = None
-                in_msgid = True
-                in_msgstr = False
-            elif line.startswith('msgstr "'):
-                current_msgstr = line[8:-1]  # Remove 'msgstr "' and trailing '"'
-                in_msgid = False
-                in_msgstr = True
-            elif line.startswith('"') and line.endswith('"'):
-                # Continuation line
-                content = line[1:-1]  # Remove surrounding quotes
-                if in_msgid:
-                    current_msgid += content
-                elif in_msgstr:
-                    current_msgstr += content
-            elif not line or line.startswith('#'):
-                # Empty line or comment - save current message
-                if current_msgid is not None and current_msgstr is not None:
-                    # Include ALL messages including header (empty msgid has charset info)
-                    messages[current_msgid] = current_msgstr
-                    current_msgid = None
-                    current_msgstr = None
-                    in_msgid = False
-                    in_msgstr = False
-
-        # Don't forget the last message
-        if current_msgid is not None and current_msgstr is not None:
-            messages[current_msgid] = current_msgstr
-
-        # Process escape sequences
-        def unescape(s):
-            return s.replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
-
-        processed_messages = {}
-        for msgid, msgstr in messages.items():
-            msgid = unescape(msgid)
-            msgstr = unescape(msgstr)
-            # Only include non-empty translations
-            if msgstr:
-                processed_messages[msgid] = msgstr
+        # parse_po already drops untranslated and fuzzy entries, so there's nothing left to filter
+        messages = parse_po(po_path)
+
+        # The runtime only reads the charset and plural rule from the header entry;
+        # the rest (Project-Id-Version, Last-Translator, dates, ...) is dead weight
+        if '' in messages:
+            kept = [line for line in messages[''].split('\n')
+                    if line.split(':', 1)[0].strip() in MO_HEADER_FIELDS]
+            messages[''] = ''.join(f"{line}\n" for line in kept)
 
         # Generate .mo file
         # .mo file format (little-endian):
@@ -86,61 +189,73 @@ def compile_po_to_mo(po_path: Path, mo_path: Path) -> bool:
         # - number of strings
         # - offset of table with original strings
         # - offset of table with translation strings
-        # - size of hashing table (0)
-        # - offset of hashing table (0)
-
-        # Sort messages by msgid for binary search
-        sorted_keys = sorted(processed_messages.keys())
+        # - size of hashing table
+        # - offset of hashing table
+        # followed by both descriptor tables, the hash table, then the strings.
 
-        # Build string data
+        # Sort messages by msgid for binary search, encoding both sides in one pass
         originals = []
         translations = []
-        for key in sorted_keys:
-            originals.append(key.encode('utf-8'))
-            translations.append(processed_messages[key].encode('utf-8'))
+        for msgid, msgstr in sorted(messages.items()):
+            originals.append(msgid.encode('utf-8'))
+            translations.append(msgstr.encode('utf-8'))
 
         # Calculate offsets
-        num_strings = len(sorted_keys)
+        num_strings = len(originals)
         header_size = 28  # 7 * 4 bytes
         orig_table_offset = header_size
         trans_table_offset = orig_table_offset + num_strings * 8
-        string_offset = trans_table_offset + num_strings * 8
-
-        # Build tables and strings
+        hash_offset = trans_table_offset + num_strings * 8
+
+        # Open-addressing hash table (GNU layout) so C gettext lookups are O(1).
+        # Slots hold 1-based string indexes; plural msgids hash on the singular only.
+        hash_size = _next_prime(max(3, (num_strings * 4) // 3))
+        hash_table = [0] * hash_size
+        for index, orig in enumerate(originals):
+            hval = _hashpjw(orig.split(b'\x00', 1)[0])
+            slot = hval % hash_size
+            incr = 1 + (hval % (hash_size - 2))
+            while hash_table[slot]:
+                slot += incr
+                if slot >= hash_size:
+                    slot -= hash_size
+            hash_table[slot] = index + 1
+
+        string_offset = hash_offset + hash_size * 4
+
+        # Build flat (length, offset) tables and collect strings for a single join
         orig_table = []
         trans_table = []
-        string_data = b''
+        string_parts = []
 
         current_offset = string_offset
         for orig in originals:
-            orig_table.append((len(orig), current_offset))
-            string_data += orig + b'\x00'
+            orig_table += (len(orig), current_offset)
+            string_parts += (orig, b'\x00')
             current_offset += len(orig) + 1
 
         for trans in translations:
-            trans_table.append((len(trans), current_offset))
-            string_data += trans + b'\x00'
+            trans_table += (len(trans), current_offset)
+            string_parts += (trans, b'\x00')
             current_offset += len(trans) + 1
 
         # Build the .mo file
-        mo_data = struct.pack(
-            '<Iiiiiii',
-            0x950412de,  # magic
-            0,           # version
-            num_strings, # number of strings
-            orig_table_offset,
-            trans_table_offset,
-            0,           # hash table size
-            0            # hash table offset
-        )
-
-        for length, offset in orig_table:
-            mo_data += struct.pack('<ii', length, offset)
-
-        for length, offset in trans_table:
-            mo_data += struct.pack('<ii', length, offset)
-
-        mo_data += string_data
+        mo_data = b''.join((
+            struct.pack(
+                '<Iiiiiii',
+                0x950412de,  # magic
+                0,           # version
+                num_strings, # number of strings
+                orig_table_offset,
+                trans_table_offset,
+                hash_size,
+                hash_offset
+            ),
+            struct.pack(f'<{len(orig_table)}i', *orig_table),
+            struct.pack(f'<{len(trans_table)}i', *trans_table),
+            struct.pack(f'<{hash_size}I', *hash_table),
+            *string_parts,
+        ))
 
         # Write .mo file
         with open(mo_path, 'wb') as f:
@@ -153,16 +268,28 @@ def compile_po_to_mo(po_path: Path, mo_path: Path) -> bool:
         return False
 
 
-def main():
-    """Compile all .po files in the locale directory."""
+def is_up_to_date(po_path: Path, mo_path: Path) -> bool:
+    """True if the .mo exists and is at least as new as its .po."""
+    return mo_path.exists() and mo_path.stat().st_mtime >= po_path.stat().st_mtime
+
+
+def main(force: bool = False, parallel: bool = True):
+    """Compile all .po files in the locale directory.
+
+    Languages whose .mo is newer than the .po are skipped unless force is set.
+    Set parallel to False when called from inside another tool's process (e.g. a
+    PyInstaller spec), where spawned workers would re-import the host's __main__.
+    """
     locale_dir = PROJECT_ROOT / "locale"
     languages = ["en", "fr", "de", "es", "zh_CN", "ar", "ja", "ko", "ru", "pt"]
     domain = "quickwhisper"
 
     print("Compiling translation files...")
     success_count = 0
+    skipped_count = 0
     error_count = 0
 
+    pending = []
     for lang in languages:
         po_path = locale_dir / lang / "LC_MESSAGES" / f"{domain}.po"
         mo_path = locale_dir / lang / "LC_MESSAGES" / f"{domain}.mo"
@@ -171,17 +298,36 @@ def main():
             print(f"  Skipping {lang}: .po file not found")
             continue
 
-        print(f"  Compiling {lang}...", end=" ")
-        if compile_po_to_mo(po_path, mo_path):
-            print("OK")
+        if not force and is_up_to_date(po_path, mo_path):
+            print(f"  {lang}: up to date")
+            skipped_count += 1
+            continue
+
+        pending.append((lang, po_path, mo_path))
+
+    if parallel and len(pending) > 1:
+        # Catalogs are independent and the compiler is pure Python (GIL-bound), so use processes
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(
+                compile_po_to_mo,
+                [po_path for _, po_path, _ in pending],
+                [mo_path for _, _, mo_path in pending],
+            ))
+    else:
+        results = [compile_po_to_mo(po_path, mo_path) for _, po_path, mo_path in pending]
+
+    for (lang, _, _), ok in zip(pending, results):
+        if ok:
+            print(f"  Compiling {lang}... OK")
             success_count += 1
         else:
-            print("FAILED")
+            print(f"  Compiling {lang}... FAILED")
             error_count += 1
 
-    print(f"\nDone: {success_count} compiled, {error_count} errors")
+    print(f"\nDone: {success_count} compiled, {skipped_count} up to date, {error_count} errors")
     return error_count == 0
 
 
 if __name__ == "__main__":
-    sys.exit(0 if main() else 1)
+    # --force recompiles every language regardless of timestamps
+    sys.exit(0 if main(force="--force" in sys.argv[1:]) else 1)
@@ -13,6 +13,8 @@ Usage:
     python tools/i18n_tools.py compile    # Compile all .po files to .mo
     python tools/i18n_tools.py all        # Run all steps
 
+    Add --force to recompile .mo files that are already newer than their .po.
+
 Requirements:
     - gettext tools (xgettext, msgmerge, msgfmt) must be installed
     - On Ubuntu/Debian: sudo apt install gettext
@@ -23,6 +25,8 @@ Requirements:
 import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Project paths
@@ -40,24 +44,31 @@ SOURCE_DIRS = [
 # Supported languages
 LANGUAGES = ["en", "fr", "de", "es", "zh_CN", "ar"]
 
+# Cached result of check_tools()
+_TOOLS_OK = None
+
 
-def run_command(cmd: list, description: str) -> bool:
-    """Run a command and return success status."""
-    print(f"  {description}...")
+def run_command(cmd: list, description: str, log=print) -> bool:
+    """Run a command and return success status.
+
+    Output goes through ``log`` so parallel callers can collect it per task.
+    """
+    log(f"  {description}...")
     try:
+        # Progress chatter on stdout is discarded; stderr is only decoded on failure
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=PROJECT_ROOT
         )
         if result.returncode != 0:
-            print(f"    Error: {result.stderr}")
+            log(f"    Error: {result.stderr.decode('utf-8', 'replace')}")
             return False
         return True
     except FileNotFoundError:
-        print(f"    Error: Command not found: {cmd[0]}")
-        print("    Make sure gettext tools are installed.")
+        log(f"    Error: Command not found: {cmd[0]}")
+        log("    Make sure gettext tools are installed.")
         return False
 
 
@@ -65,16 +76,16 @@ def extract_strings():
     """Extract translatable strings from Python source files to .pot template."""
     print("\n[1/3] Extracting translatable strings...")
 
-    # Collect all Python files
-    py_files = []
+    # Collect all Python files (dict keeps order and drops files found via both source dirs)
+    py_files = {}
     for source_dir in SOURCE_DIRS:
         if source_dir.is_dir():
             for py_file in source_dir.glob("**/*.py"):
                 # Skip __pycache__ and venv directories
                 if "__pycache__" not in str(py_file) and "venv" not in str(py_file):
-                    py_files.append(str(py_file.relative_to(PROJECT_ROOT)))
+                    py_files[str(py_file.relative_to(PROJECT_ROOT))] = None
         elif source_dir.is_file() and source_dir.suffix == ".py":
-            py_files.append(str(source_dir.relative_to(PROJECT_ROOT)))
+            py_files[str(source_dir.relative_to(PROJECT_ROOT))] = None
 
     if not py_files:
         print("  No Python files found!")
@@ -85,6 +96,12 @@ def extract_strings():
     # Create locale directory if it doesn't exist
     LOCALE_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Pass the file list via --files-from so long lists can't exceed the
+    # command-line length limit (notably on Windows)
+    files_from = tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False)
+    with files_from:
+        files_from.write('\n'.join(py_files))
+
     # Run xgettext to extract strings
     # Using _() and _n() as marker functions
     cmd = [
@@ -100,17 +117,20 @@ def extract_strings():
         "--package-name=QuickWhisper",
         "--package-version=2.0",
         "--msgid-bugs-address=support@scorchsoft.com",
-    ] + py_files
+        f"--files-from={files_from.name}",
+    ]
 
-    success = run_command(cmd, "Running xgettext")
+    try:
+        success = run_command(cmd, "Running xgettext")
+    finally:
+        os.unlink(files_from.name)
 
     if success and POT_FILE.exists():
         print(f"  Created: {POT_FILE}")
-        # Count strings
+        # Count strings line by line rather than reading the whole template
         with open(POT_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-            msgid_count = content.count('msgid "') - 1  # Subtract header
-            print(f"  Extracted {msgid_count} translatable strings")
+            msgid_count = sum(1 for line in f if line.startswith('msgid "')) - 1  # Subtract header
+        print(f"  Extracted {msgid_count} translatable strings")
 
     return success
 
@@ -164,29 +184,45 @@ def update_po_files():
     return success
 
 
-def compile_po_files():
-    """Compile all .po files to .mo binary format."""
-    print("\n[3/3] Compiling .po files to .mo...")
+def _compile_language(lang: str, force: bool):
+    """Compile one language for compile_po_files. Returns (success, output lines)."""
+    po_file = LOCALE_DIR / lang / "LC_MESSAGES" / f"{DOMAIN}.po"
+    mo_file = LOCALE_DIR / lang / "LC_MESSAGES" / f"{DOMAIN}.mo"
+    output = []
 
-    success = True
-    for lang in LANGUAGES:
-        po_file = LOCALE_DIR / lang / "LC_MESSAGES" / f"{DOMAIN}.po"
-        mo_file = LOCALE_DIR / lang / "LC_MESSAGES" / f"{DOMAIN}.mo"
+    if not po_file.exists():
+        output.append(f"  Skipping {lang}: .po file not found")
+        return True, output
 
-        if not po_file.exists():
-            print(f"  Skipping {lang}: .po file not found")
-            continue
+    if not force and mo_file.exists() and mo_file.stat().st_mtime >= po_file.stat().st_mtime:
+        output.append(f"  {lang}: up to date")
+        return True, output
 
-        cmd = [
-            "msgfmt",
-            "--output-file", str(mo_file),
-            str(po_file)
-        ]
+    cmd = [
+        "msgfmt",
+        "--output-file", str(mo_file),
+        str(po_file)
+    ]
+
+    if run_command(cmd, f"Compiling {lang}", log=output.append):
+        output.append(f"    Created: {mo_file}")
+        return True, output
+    return False, output
 
-        if run_command(cmd, f"Compiling {lang}"):
-            print(f"    Created: {mo_file}")
-        else:
-            success = False
+
+def compile_po_files(force: bool = False):
+    """Compile all .po files to .mo binary format, skipping up-to-date ones unless forced."""
+    print("\n[3/3] Compiling .po files to .mo...")
+
+    # Each language is an independent msgfmt process, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(LANGUAGES))) as executor:
+        results = list(executor.map(lambda lang: _compile_language(lang, force), LANGUAGES))
+
+    success = True
+    for ok, output in results:
+        for line in output:
+            print(line)
+        success = success and ok
 
     return success
 
@@ -210,13 +246,17 @@ def compile_single(lang: str):
 
 
 def check_tools():
-    """Check if required gettext tools are available."""
+    """Check if required gettext tools are available (probed once per run)."""
+    global _TOOLS_OK
+    if _TOOLS_OK is not None:
+        return _TOOLS_OK
+
     tools = ["xgettext", "msgmerge", "msgfmt"]
     missing = []
 
     for tool in tools:
         try:
-            subprocess.run([tool, "--version"], capture_output=True)
+            subprocess.run([tool, "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except FileNotFoundError:
             missing.append(tool)
 
@@ -226,8 +266,10 @@ def check_tools():
         print("  Ubuntu/Debian: sudo apt install gettext")
         print("  macOS: brew install gettext && brew link gettext --force")
         print("  Windows: https://mlocati.github.io/articles/gettext-iconv-windows.html")
+        _TOOLS_OK = False
         return False
 
+    _TOOLS_OK = True
     return True
 
 
@@ -238,6 +280,7 @@ def main():
         sys.exit(1)
 
     command = sys.argv[1].lower()
+    force = "--force" in sys.argv[2:]
 
     if command == "check":
         if check_tools():
@@ -252,9 +295,9 @@ def main():
     elif command == "update":
         success = update_po_files()
     elif command == "compile":
-        success = compile_po_files()
+        success = compile_po_files(force)
     elif command == "all":
-        success = extract_strings() and update_po_files() and compile_po_files()
+        success = extract_strings() and update_po_files() and compile_po_files(force)
     elif command == "compile-single" and len(sys.argv) > 2:
         success = compile_single(sys.argv[2])
     else:
@@ -1,14 +1,21 @@
 import threading
 from concurrent.futures import ThreadPoolExecutor
+import io
 import pyaudio
-import wave
+import shutil
+import struct
+import subprocess
 from pathlib import Path
 from tkinter import messagebox
 from audioplayer import AudioPlayer
 import os
-import sys
-import time
 from utils.config_manager import get_config
+from utils.i18n import _
+
+try:
+    import winsound  # Windows only: plays WAV data straight from memory
+except ImportError:
+    winsound = None
 
 # Memory diagnostic counters for audio subsystem
 _audio_diag = {
@@ -16,6 +23,7 @@ _audio_diag = {
     'streams_opened': 0,
     'streams_closed': 0,
     'frames_peak': 0,
+    'input_overflows': 0,
     'recordings_started': 0,
     'recordings_stopped': 0,
 }
@@ -24,20 +32,79 @@ def get_audio_diagnostics():
     """Return a copy of audio diagnostic counters."""
     return dict(_audio_diag)
 
+# Bounds for the configurable frames per PortAudio buffer (16-512 ms at 16 kHz).
+# Capture runs in callback mode, so PortAudio's own thread absorbs GC pauses and
+# Tk redraws; larger buffers only add to the tail that is dropped when a stop
+# aborts the stream, smaller ones mean more Python callbacks per second.
+MIN_FRAMES_PER_BUFFER = 256
+MAX_FRAMES_PER_BUFFER = 8192
+
+# Optional ffmpeg used to compress uploads to Ogg/Opus (speech is transparent at 16 kbps,
+# roughly 16x smaller than 16 kHz PCM WAV). Uploads fall back to the WAV when unavailable.
+FFMPEG_PATH = shutil.which("ffmpeg")
+OPUS_BITRATE = "16k"
+
+# UI sounds allowed to wait for the sound thread before new ones are dropped
+MAX_QUEUED_SOUNDS = 4
+
+# Short UI feedback sounds, preloaded once so a beep skips file open and decoder setup
+SOUND_EFFECTS = (
+    "assets/pop.wav",
+    "assets/pop-down.wav",
+    "assets/double-pop-down.wav",
+    "assets/wrong-short.wav",
+)
+
+# Canonical 44-byte RIFF/WAVE header for 16-bit PCM
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def write_wav(path, pcm, rate=16000, channels=1, sample_width=2):
+    """Write PCM data to a WAV file as a preformed header plus raw samples.
+
+    Skips the wave module's per-call bookkeeping and header seeks; the format is
+    fixed, so the header is fully known before anything is written.
+    """
+    data_size = len(pcm)
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, rate,
+        rate * channels * sample_width,  # byte rate
+        channels * sample_width,         # block align
+        sample_width * 8,                # bits per sample
+        b'data', data_size
+    )
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        for chunk in (header, pcm):
+            view = memoryview(chunk)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+    finally:
+        os.close(fd)
+
 
 class AudioManager:
     def __init__(self, parent):
         self.parent = parent
         self.audio = pyaudio.PyAudio()
         self._recording_event = threading.Event()  # Thread-safe recording flag
-        self.frames = []
-        self.record_thread = None
+        self.frames = bytearray()
+        self._max_bytes = 0  # Capture size cap for the current recording, 0 = none
         self.stream = None
         self.device_index = None
+        self._device_map = None  # Cached input device name -> index map
         self.audio_file = None
         self.config = get_config()
-        # Thread pool for sound playback to avoid spawning unbounded threads
-        self._sound_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sound")
+        # One long-lived sound thread: clicks play in order and never fight over the
+        # output device; the semaphore caps the backlog so stale clicks are dropped
+        self._sound_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sound")
+        self._sound_slots = threading.BoundedSemaphore(MAX_QUEUED_SOUNDS)
+        self._sound_data = {}
+        self._players = {}
+        self._preload_sounds()
 
     @property
     def recording(self):
@@ -53,21 +120,38 @@ class AudioManager:
             self._recording_event.clear()
         
     def get_input_devices(self):
-        """Get a list of available input audio devices."""
-        devices = {}
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            if info['maxInputChannels'] > 0:
-                devices[info['name']] = i
-        return devices
+        """Get a list of available input audio devices.
+
+        The name -> index map is cached, so repeated calls (and every
+        start_recording) skip the PortAudio enumeration. Use
+        refresh_input_devices() to pick up newly connected hardware.
+        """
+        if self._device_map is None:
+            devices = {}
+            for i in range(self.audio.get_device_count()):
+                info = self.audio.get_device_info_by_index(i)
+                if info['maxInputChannels'] > 0:
+                    devices[info['name']] = i
+            self._device_map = devices
+        return dict(self._device_map)
+
+    def refresh_input_devices(self):
+        """Re-enumerate input devices, re-initialising PortAudio so new hardware is seen."""
+        if not self.recording:
+            # PortAudio only scans for devices when it is initialised
+            self.audio.terminate()
+            self.audio = pyaudio.PyAudio()
+        self._device_map = None
+        return self.get_input_devices()
 
     def get_device_index_by_name(self, device_name):
         """Find device index based on selected device name (input devices only)."""
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            # Must match name AND be an input device (maxInputChannels > 0)
-            if info['name'] == device_name and info['maxInputChannels'] > 0:
-                return i
+        if self._device_map is None:
+            self.get_input_devices()
+        # Read the cached map directly; get_input_devices() hands out a copy
+        index = self._device_map.get(device_name)
+        if index is not None:
+            return index
         raise ValueError(f"Input device '{device_name}' not found.")
         
     def start_recording(self):
@@ -83,23 +167,31 @@ class AudioManager:
         print(f"Getting Device Index for: '{selected_name}'")
         try:
             self.device_index = self.get_device_index_by_name(selected_name)
-            # Log the actual device info for verification
-            device_info = self.audio.get_device_info_by_index(self.device_index)
-            print(f"Recording from device index {self.device_index}: '{device_info['name']}' (Input channels: {device_info['maxInputChannels']})")
+            print(f"Recording from device index {self.device_index}: '{selected_name}'")
         except ValueError as e:
             messagebox.showerror("Device Error", str(e))
             return False
 
         print("Starting Stream")
-        self.stream = self.audio.open(format=pyaudio.paInt16,
-                                      channels=1,
-                                      rate=16000,
-                                      input=True,
-                                      frames_per_buffer=1024,
-                                      input_device_index=self.device_index)
-
-        self.frames = []
+        frames_per_buffer = self._frames_per_buffer()
+        self._max_bytes = self._max_recording_bytes()
+        self.frames = bytearray()
         self.recording = True
+        try:
+            # Callback mode: PortAudio delivers audio from its own thread, so no
+            # Python read loop is needed to drain the input buffer
+            self.stream = self.audio.open(format=pyaudio.paInt16,
+                                          channels=1,
+                                          rate=16000,
+                                          input=True,
+                                          frames_per_buffer=frames_per_buffer,
+                                          input_device_index=self.device_index,
+                                          stream_callback=self._on_audio_chunk)
+        except OSError as e:
+            self.recording = False
+            print(f"Error opening audio stream: {e}")
+            messagebox.showerror("Recording error", f"Could not open the audio input stream: {e}")
+            return False
 
         # Update UI in parent - now through ui_manager
         self.parent.ui_manager.update_button_states(recording=True)
@@ -109,57 +201,78 @@ class AudioManager:
         _audio_diag['streams_opened'] += 1
 
         # Play start recording sound
-        self._sound_pool.submit(self.play_sound, "assets/pop.wav")
+        self.play_sound_async("assets/pop.wav")
 
-        # Start recording in a separate thread
         print("Starting Recording")
-        self.record_thread = threading.Thread(target=self.record, daemon=True)
-        print("Starting Recording thread")
-        self.record_thread.start()
         return True
 
-    def record(self):
-        """Record audio data from the stream."""
-        while self._recording_event.is_set():
-            try:
-                # Use a smaller timeout to allow checking the stop flag more frequently
-                if self.stream and self.stream.is_active():
-                    data = self.stream.read(1024, exception_on_overflow=False)
-                    self.frames.append(data)
-                else:
-                    break
-            except OSError as e:
-                # Stream was closed - this is expected when stopping
-                if not self._recording_event.is_set():
-                    break
-                print(f"Recording OSError: {e}")
-                break
-            except Exception as e:
-                print(f"Recording error: {e}")
-                # Only show error dialog if we're still supposed to be recording
-                if self._recording_event.is_set():
-                    self.parent.after(0, lambda: messagebox.showerror("Recording error", f"An error occurred while Recording: {e}"))
-                break
+    def _frames_per_buffer(self):
+        """Return the configured capture buffer size, clamped to a sane range."""
+        try:
+            frames = int(self.config.audio_frames_per_buffer)
+        except (TypeError, ValueError):
+            frames = 1024
+        return max(MIN_FRAMES_PER_BUFFER, min(frames, MAX_FRAMES_PER_BUFFER))
 
-    def stop_recording(self):
-        """Stop recording and save the audio file."""
-        self.recording = False
+    def _max_recording_bytes(self):
+        """Return the PCM byte cap for one recording (16 kHz mono 16-bit), or 0 for none."""
+        try:
+            seconds = int(self.config.max_recording_seconds)
+        except (TypeError, ValueError):
+            seconds = 0
+        return max(seconds, 0) * 16000 * 2
+
+    def _on_max_length_reached(self, frames):
+        """Stop a recording that hit the length cap and transcribe it (Tk thread)."""
+        # Ignore if the user already stopped it, or a new recording has begun since
+        if self.recording and frames is self.frames:
+            self.parent.stop_recording()
+            # Set after stopping: stop_recording overwrites the status with its own message
+            self.parent.ui_manager.set_status(_("Maximum recording length reached"), "orange")
+
+    def _on_audio_chunk(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback - runs on PortAudio's audio thread.
+
+        Must stay short and must never touch Tk widgets directly; work for the Tk
+        thread is handed over with after(). Overflows are only counted so they
+        show up in the memory diagnostics log.
+        """
+        if status & pyaudio.paInputOverflow:
+            _audio_diag['input_overflows'] += 1
+        if not self._recording_event.is_set():
+            return (None, pyaudio.paComplete)
+        self.frames.extend(in_data)
+        if self._max_bytes and len(self.frames) >= self._max_bytes:
+            # Stop capturing here; the stop itself has to happen on the Tk thread
+            self.parent.after(0, self._on_max_length_reached, self.frames)
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+
+    def _close_stream(self):
+        """Close the capture stream without draining it.
+
+        The recording event is already cleared, so the callback appends nothing
+        further. Closing an active callback stream aborts it: PortAudio only waits
+        for an in-flight callback to return rather than for the queued buffers to
+        play out, so this returns immediately on the Tk thread.
+        """
+        stream, self.stream = self.stream, None
+        if stream is None:
+            return
+        try:
+            stream.close()
+        except Exception as e:
+            print(f"Error closing stream: {e}")
 
-        # Wait for record thread to finish with timeout
-        if self.record_thread:
-            self.record_thread.join(timeout=2.0)
-            if self.record_thread.is_alive():
-                print("Warning: Record thread did not stop in time")
+    def stop_recording(self):
+        """Stop recording and reserve the output file.
 
-        # Safely close the stream
-        if self.stream:
-            try:
-                self.stream.stop_stream()
-                self.stream.close()
-            except Exception as e:
-                print(f"Error closing stream: {e}")
-            finally:
-                self.stream = None
+        Returns ``(path, frames)``: the path the recording will be written to and
+        the captured frames. Callers pass both to ``write_audio_file``, off the Tk
+        thread; nothing is left in shared state for a later stop to overwrite.
+        """
+        self.recording = False
+        self._close_stream()
 
         print(f"Stopping, about to trigger '{self.parent.current_button_mode}' mode...")
 
@@ -171,7 +284,7 @@ class AudioManager:
         self.parent.ui_manager.set_status("Processing - Audio File...", "green")
 
         # Play stop recording sound
-        self._sound_pool.submit(self.play_sound, "assets/pop-down.wav")
+        self.play_sound_async("assets/pop-down.wav")
 
         # Ensure tmp folder exists
         tmp_dir = self.parent.tmp_dir
@@ -190,40 +303,58 @@ class AudioManager:
             filename = "temp_recording.wav"
         
         self.audio_file = tmp_dir / filename
-        print(f"Saving Recording to {self.audio_file}")
 
-        with wave.open(str(self.audio_file), 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-            wf.setframerate(16000)
-            wf.writeframes(b''.join(self.frames))
+        # Track peak frame count, then hand the frames over to the caller
+        _audio_diag['frames_peak'] = max(_audio_diag['frames_peak'], len(self.frames) // (self._frames_per_buffer() * 2))
+        frames = self.frames
+        self.frames = bytearray()
+
+        return self.audio_file, frames
 
-        # Track peak frame count then release memory
-        _audio_diag['frames_peak'] = max(_audio_diag['frames_peak'], len(self.frames))
-        self.frames = []
+    def write_audio_file(self, path, frames):
+        """Write frames returned by ``stop_recording`` to ``path``.
 
-        return self.audio_file
+        Safe to call from a worker thread; touches no Tk state.
+        """
+        print(f"Saving Recording to {path}")
+        # The bytearray is written as-is; no joined copy of the whole recording
+        write_wav(path, frames)
+        return path
     
+    def open_for_upload(self, file_path):
+        """Open a recording for upload to the transcription API.
+
+        Returns an Ogg/Opus encoded in-memory file when ffmpeg is available, or the
+        WAV file itself otherwise. Either way the result is a binary file object
+        with a ``name`` the API uses to detect the format.
+        """
+        if FFMPEG_PATH:
+            try:
+                result = subprocess.run(
+                    [FFMPEG_PATH, "-hide_banner", "-loglevel", "error",
+                     "-i", str(file_path),
+                     "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip",
+                     "-f", "ogg", "pipe:1"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                    timeout=60,
+                )
+                if result.returncode == 0 and result.stdout:
+                    upload = io.BytesIO(result.stdout)
+                    upload.name = f"{Path(file_path).stem}.ogg"
+                    print(f"Encoded upload as Ogg/Opus: {len(result.stdout)} bytes")
+                    return upload
+                print(f"ffmpeg encode failed, uploading WAV: {result.stderr.decode('utf-8', 'replace').strip()}")
+            except Exception as e:
+                print(f"ffmpeg encode failed, uploading WAV: {e}")
+        return open(str(file_path), "rb")
+
     def cancel_recording(self):
         """Cancels the current recording without processing."""
         if self.recording:
             self.recording = False
-
-            # Wait for record thread to finish with timeout
-            if self.record_thread:
-                self.record_thread.join(timeout=2.0)
-                if self.record_thread.is_alive():
-                    print("Warning: Record thread did not stop in time during cancel")
-
-            # Safely close the stream
-            if self.stream:
-                try:
-                    self.stream.stop_stream()
-                    self.stream.close()
-                except Exception as e:
-                    print(f"Error closing stream during cancel: {e}")
-                finally:
-                    self.stream = None
+            self._close_stream()
 
             # Reset buttons back to original state - now through ui_manager
             self.parent.ui_manager.update_button_states(recording=False)
@@ -231,13 +362,13 @@ class AudioManager:
             _audio_diag['streams_closed'] += 1
 
             # Release recorded frames on cancel
-            self.frames = []
+            self.frames = bytearray()
 
             # Reset status
             self.parent.ui_manager.set_status("Idle", "blue")
 
             # Play failure sound
-            self._sound_pool.submit(self.play_sound, "assets/wrong-short.wav")
+            self.play_sound_async("assets/wrong-short.wav")
             return True
         return False
     
@@ -248,10 +379,16 @@ class AudioManager:
         if file_handling == "timestamp":
             # Find the most recent recording file
             try:
-                recording_files = list(self.parent.tmp_dir.glob("recording_*.wav"))
-                if recording_files:
-                    # Sort by modification time and get the most recent
-                    last_recording = max(recording_files, key=lambda f: f.stat().st_mtime)
+                # One directory scan; DirEntry caches its stat, so no extra stat per file
+                with os.scandir(self.parent.tmp_dir) as entries:
+                    newest = max(
+                        (e for e in entries
+                         if e.name.startswith("recording_") and e.name.endswith(".wav") and e.is_file()),
+                        key=lambda e: e.stat().st_mtime,
+                        default=None
+                    )
+                if newest is not None:
+                    last_recording = Path(newest.path)
                 else:
                     messagebox.showerror("Retry Failed", "No previous recordings found.")
                     return False
@@ -264,19 +401,64 @@ class AudioManager:
 
         if last_recording.exists():
             # Play start recording sound
-            self._sound_pool.submit(self.play_sound, "assets/pop.wav")
+            self.play_sound_async("assets/pop.wav")
 
-            self.audio_file = last_recording
             self.parent.ui_manager.set_status("Retrying transcription...", "orange")
 
-            # Re-attempt transcription in a separate thread
-            threading.Thread(target=self.parent.transcribe_audio, daemon=True).start()
+            # Re-attempt transcription on the app's work pool, queued behind any
+            # transcription that is still running; the path goes with the job
+            self.parent.retranscribe(last_recording)
             return True
         else:
             messagebox.showerror("Retry Failed", "No previous recording found to retry.")
             return False
     
+    def _preload_sounds(self):
+        """Cache playback resources for the fixed set of UI sounds.
+
+        On Windows the raw WAV bytes are kept for winsound; elsewhere one
+        AudioPlayer per file is kept and replayed.
+        """
+        for sound_file in SOUND_EFFECTS:
+            try:
+                path = self.resource_path(sound_file)
+                if winsound is not None:
+                    with open(path, 'rb') as f:
+                        self._sound_data[sound_file] = f.read()
+                else:
+                    self._players[sound_file] = AudioPlayer(path)
+            except Exception as e:
+                print(f"Warning: Could not preload sound '{sound_file}': {e}")
+
+    def play_sound_async(self, sound_file):
+        """Queue a UI sound on the sound thread, dropping it if the backlog is full."""
+        if not self._sound_slots.acquire(blocking=False):
+            return
+        try:
+            future = self._sound_pool.submit(self.play_sound, sound_file)
+        except RuntimeError:
+            # Pool already shut down during exit
+            self._sound_slots.release()
+            return
+        future.add_done_callback(lambda _f: self._sound_slots.release())
+
     def play_sound(self, sound_file):
+        """Play a UI sound, using the preloaded cache when available."""
+        try:
+            data = self._sound_data.get(sound_file)
+            player = self._players.get(sound_file)
+            if data is not None:
+                winsound.PlaySound(data, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            elif player is not None:
+                player.play(block=True)
+            else:
+                self._play_uncached(sound_file)
+                return
+            _audio_diag['sounds_played'] += 1
+        except Exception as e:
+            print(f"Warning: Could not play sound: {e}")
+
+    def _play_uncached(self, sound_file):
         """Play sound with fallback for Mac compatibility.
 
         Explicitly closes the AudioPlayer after playback to prevent
@@ -297,28 +479,17 @@ class AudioManager:
                 except Exception:
                     pass
                 del player
-            
+
     def resource_path(self, relative_path):
-        """Get the absolute path to the resource, works for both development and PyInstaller environments."""
-        try:
-            base_path = sys._MEIPASS
-        except AttributeError:
-            base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
-
-        # Handle icon files differently for Mac
-        is_mac = self.parent.is_mac
-        if is_mac and relative_path.endswith('.ico'):
-            # Use .png version instead of .ico for Mac
-            relative_path = relative_path.replace('.ico', '.png')
-
-        abs_path = os.path.join(base_path, relative_path)
-        return abs_path
+        """Get the absolute path to the resource, using the app's cached lookup."""
+        return self.parent.resource_path(relative_path)
     
     def cleanup(self):
         """Clean up resources when closing."""
         try:
             if self.recording:
-                self.stop_recording()
+                # No work pool job will run at exit, so save the recording here
+                self.write_audio_file(*self.stop_recording())
             self.audio.terminate()
         except Exception as e:
             print(f"Error during audio cleanup: {e}")
@@ -329,8 +500,16 @@ class AudioManager:
                 print(f"Error during audio termination: {e2}")
         # Shutdown the sound thread pool
         try:
-            self._sound_pool.shutdown(wait=False)
+            self._sound_pool.shutdown(wait=False, cancel_futures=True)
         except Exception:
             pass
+        # Release cached sound players
+        for player in self._players.values():
+            try:
+                player.close()
+            except Exception:
+                pass
+        self._players.clear()
+        self._sound_data.clear()
         # Release any held frame data
-        self.frames = []
\ No newline at end of file
+        self.frames = bytearray()
\ No newline at end of file
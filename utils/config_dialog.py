@@ -1,48 +1,145 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import customtkinter as ctk
 from pathlib import Path
+import logging
 import os
-import platform
 import time
+from functools import partial
+from types import MappingProxyType
 from utils.config_manager import get_config
 from utils.theme import get_font, get_font_size, get_font_family, get_window_size, get_button_height, get_spacing
-from utils.platform import open_url
+from utils.platform import open_url, IS_WINDOWS, IS_MACOS
 from utils.i18n import (
     _, _n, set_language, get_current_language, detect_os_locale,
     get_detected_locale_display, get_available_languages, SUPPORTED_LANGUAGES
 )
 
+logger = logging.getLogger(__name__)
+
 # Theme colors for dark mode (used in AI Models section)
 THEME_TEXT_MUTED = "#909090"
 THEME_ACCENT = "#22d3ee"
 THEME_ACCENT_HOVER = "#67e8f9"
 
+# Whisper supported languages
+WHISPER_LANGUAGES = MappingProxyType({
+    "auto": "Auto Detect",
+    "af": "Afrikaans",
+    "ar": "Arabic",
+    "hy": "Armenian",
+    "az": "Azerbaijani",
+    "be": "Belarusian",
+    "bs": "Bosnian",
+    "bg": "Bulgarian",
+    "ca": "Catalan",
+    "zh": "Chinese",
+    "hr": "Croatian",
+    "cs": "Czech",
+    "da": "Danish",
+    "nl": "Dutch",
+    "en": "English",
+    "et": "Estonian",
+    "fi": "Finnish",
+    "fr": "French",
+    "gl": "Galician",
+    "de": "German",
+    "el": "Greek",
+    "he": "Hebrew",
+    "hi": "Hindi",
+    "hu": "Hungarian",
+    "is": "Icelandic",
+    "id": "Indonesian",
+    "it": "Italian",
+    "ja": "Japanese",
+    "kn": "Kannada",
+    "kk": "Kazakh",
+    "ko": "Korean",
+    "lv": "Latvian",
+    "lt": "Lithuanian",
+    "mk": "Macedonian",
+    "ms": "Malay",
+    "mr": "Marathi",
+    "mi": "Maori",
+    "ne": "Nepali",
+    "no": "Norwegian",
+    "fa": "Persian",
+    "pl": "Polish",
+    "pt": "Portuguese",
+    "ro": "Romanian",
+    "ru": "Russian",
+    "sr": "Serbian",
+    "sk": "Slovak",
+    "sl": "Slovenian",
+    "es": "Spanish",
+    "sw": "Swahili",
+    "sv": "Swedish",
+    "tl": "Tagalog",
+    "ta": "Tamil",
+    "th": "Thai",
+    "tr": "Turkish",
+    "uk": "Ukrainian",
+    "ur": "Urdu",
+    "vi": "Vietnamese",
+    "cy": "Welsh"
+})
+
+# Language combobox rows, built once: Auto Detect first, the rest sorted by name
+_LANG_ITEMS = (("auto", WHISPER_LANGUAGES["auto"]),) + tuple(
+    sorted(((code, name) for code, name in WHISPER_LANGUAGES.items() if code != "auto"),
+           key=lambda item: item[1])
+)
+_LANG_COMBO_VALUES = tuple(f"{name} ({code})" for code, name in _LANG_ITEMS)
+_LANG_CODE_TO_DISPLAY = {code: display for (code, _name), display in zip(_LANG_ITEMS, _LANG_COMBO_VALUES)}
+
+# Transcription models and their types
+TRANSCRIPTION_MODELS = MappingProxyType({
+    "gpt-4o-transcribe": "gpt",
+    "whisper-1": "whisper",
+    "other": "unknown"
+})
+
+# How long the inline "Settings Saved" confirmation shows before the dialog closes
+SAVED_CLOSE_DELAY_MS = 800
+
+# Fallback start folder for the custom location picker
+_HOME = os.path.expanduser("~")
+
+# Combobox rows for the transcription model picker, in table order
+_TRANSCRIPTION_MODEL_KEYS = tuple(TRANSCRIPTION_MODELS)
+
+# LLM models for copy-editing
+LLM_MODELS = (
+    "gpt-5",
+    "gpt-5-mini",
+    "gpt-5-nano",
+    "gpt-4.1",
+    "gpt-4.1-mini",
+    "gpt-4.1-nano",
+    "gpt-4o",
+    "gpt-4o-mini",
+    "other"
+)
+
+
 class ConfigDialog:
     def __init__(self, parent):
         _t0 = time.perf_counter()
-        print(f"[CONFIG DIALOG] __init__ started")
+        logger.debug("__init__ started")
 
         self.parent = parent
         self.dialog = tk.Toplevel(parent)
         self.dialog.withdraw()  # Hide window until UI is built
         self.dialog.title(_("Configuration Settings"))
-        print(f"[CONFIG DIALOG] Toplevel created: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Get window dimensions from theme
-        window_width, window_height = get_window_size('config_dialog')
-        self.dialog.geometry(f"{window_width}x{window_height}")
+        logger.debug("Toplevel created: %.1fms", (time.perf_counter() - _t0) * 1000)
 
-        # Center the window
-        position_x = parent.winfo_x() + (parent.winfo_width() - window_width) // 2
-        position_y = parent.winfo_y() + (parent.winfo_height() - window_height) // 2
-        self.dialog.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
+        # Size and centre the (still hidden) window in a single geometry call
+        self._center_on_parent()
 
         self.dialog.transient(parent)
 
         # Handle window close (X button) to ensure hotkeys are resumed
         self.dialog.protocol("WM_DELETE_WINDOW", self._close_dialog)
-        print(f"[CONFIG DIALOG] Window configured: {(time.perf_counter() - _t0)*1000:.1f}ms")
+        logger.debug("Window configured: %.1fms", (time.perf_counter() - _t0) * 1000)
 
         # Variables for settings
         self.recording_location_var = tk.StringVar()
@@ -62,127 +159,105 @@ class ConfigDialog:
         self.custom_transcription_model_var = tk.StringVar()
         self.llm_model_var = tk.StringVar()
         self.custom_llm_model_var = tk.StringVar()
+        self._pending_model_layout = False
+        self._location_update_id = None
+        self._pause_after_id = None
+        self._close_after_id = None
+        self._awaiting_map = False
+
+        # Grab and pause hotkeys once the window manager maps the dialog, instead of
+        # blocking in wait_visibility(); kept bound because the dialog is reused
+        self.dialog.bind('<Map>', self._on_mapped, add='+')
+
+        # Registered once here: a trace added per panel build would pile up across opens
+        self.recording_location_var.trace_add("write", self._schedule_location_update)
 
         # Track original HiDPI setting for restart prompt
         self.original_hidpi_mode = None
-        print(f"[CONFIG DIALOG] Variables initialized: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Define Whisper supported languages
-        self.languages = {
-            "auto": "Auto Detect",
-            "af": "Afrikaans",
-            "ar": "Arabic",
-            "hy": "Armenian",
-            "az": "Azerbaijani",
-            "be": "Belarusian",
-            "bs": "Bosnian",
-            "bg": "Bulgarian",
-            "ca": "Catalan",
-            "zh": "Chinese",
-            "hr": "Croatian",
-            "cs": "Czech",
-            "da": "Danish",
-            "nl": "Dutch",
-            "en": "English",
-            "et": "Estonian",
-            "fi": "Finnish",
-            "fr": "French",
-            "gl": "Galician",
-            "de": "German",
-            "el": "Greek",
-            "he": "Hebrew",
-            "hi": "Hindi",
-            "hu": "Hungarian",
-            "is": "Icelandic",
-            "id": "Indonesian",
-            "it": "Italian",
-            "ja": "Japanese",
-            "kn": "Kannada",
-            "kk": "Kazakh",
-            "ko": "Korean",
-            "lv": "Latvian",
-            "lt": "Lithuanian",
-            "mk": "Macedonian",
-            "ms": "Malay",
-            "mr": "Marathi",
-            "mi": "Maori",
-            "ne": "Nepali",
-            "no": "Norwegian",
-            "fa": "Persian",
-            "pl": "Polish",
-            "pt": "Portuguese",
-            "ro": "Romanian",
-            "ru": "Russian",
-            "sr": "Serbian",
-            "sk": "Slovak",
-            "sl": "Slovenian",
-            "es": "Spanish",
-            "sw": "Swahili",
-            "sv": "Swedish",
-            "tl": "Tagalog",
-            "ta": "Tamil",
-            "th": "Thai",
-            "tr": "Turkish",
-            "uk": "Ukrainian",
-            "ur": "Urdu",
-            "vi": "Vietnamese",
-            "cy": "Welsh"
-        }
-
-        # Define transcription models and their types
-        self.transcription_models = {
-            "gpt-4o-transcribe": "gpt",
-            "whisper-1": "whisper",
-            "other": "unknown"
-        }
-
-        # Define LLM models for copy-editing
-        self.llm_models = [
-            "gpt-5",
-            "gpt-5-mini",
-            "gpt-5-nano",
-            "gpt-4.1",
-            "gpt-4.1-mini",
-            "gpt-4.1-nano",
-            "gpt-4o",
-            "gpt-4o-mini",
-            "other"
-        ]
-        print(f"[CONFIG DIALOG] Static data defined: {(time.perf_counter() - _t0)*1000:.1f}ms")
+        logger.debug("Variables initialized: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+        # Whisper supported languages (module constant)
+        self.languages = WHISPER_LANGUAGES
+
+        # Model choices (module constants, shared by every dialog instance)
+        self.transcription_models = TRANSCRIPTION_MODELS
+        self.llm_models = LLM_MODELS
+        logger.debug("Static data defined: %.1fms", (time.perf_counter() - _t0) * 1000)
 
         # Load current settings
         self.load_current_settings()
-        print(f"[CONFIG DIALOG] Settings loaded: {(time.perf_counter() - _t0)*1000:.1f}ms")
+        logger.debug("Settings loaded: %.1fms", (time.perf_counter() - _t0) * 1000)
         
         # Current selected category
         self.current_category = "Recording"
 
         self.create_dialog()
-        print(f"[CONFIG DIALOG] create_dialog() done: {(time.perf_counter() - _t0)*1000:.1f}ms")
+        logger.debug("create_dialog() done: %.1fms", (time.perf_counter() - _t0) * 1000)
 
+        # Remember the UI language the widgets were built in; see is_reusable()
+        self._built_language = get_current_language()
+
+        self._show()
+        logger.debug("__init__ complete: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+    def _center_on_parent(self):
+        """Size the dialog from the theme and centre it over the main window."""
+        window_width, window_height = get_window_size('config_dialog')
+        position_x = self.parent.winfo_x() + (self.parent.winfo_width() - window_width) // 2
+        position_y = self.parent.winfo_y() + (self.parent.winfo_height() - window_height) // 2
+        self.dialog.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
+
+    def _show(self):
+        """Show the (already built) dialog modally and pause global hotkeys."""
         # Force Tkinter to process all widget geometry before showing
         # This prevents the black flash by ensuring widgets are rendered
         self.dialog.update_idletasks()
-        print(f"[CONFIG DIALOG] update_idletasks() done: {(time.perf_counter() - _t0)*1000:.1f}ms")
+
+        # Modal grab and hotkey pause happen in _on_mapped once the window is visible
+        self._awaiting_map = True
 
         # Show window now that UI is fully built (prevents black flash)
         self.dialog.deiconify()
-        print(f"[CONFIG DIALOG] deiconify() done: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Make dialog modal after UI is built (faster perceived load)
-        self.dialog.wait_visibility()  # Wait for dialog to be visible before grabbing (Linux fix)
-        print(f"[CONFIG DIALOG] wait_visibility() done: {(time.perf_counter() - _t0)*1000:.1f}ms")
+        self.dialog.lift()
+
+    def _on_mapped(self, event):
+        """Make the dialog modal and pause hotkeys once it has been mapped."""
+        # Child widgets share the toplevel's bindtag, so their <Map> events land here too
+        if event.widget is not self.dialog or not self._awaiting_map:
+            return
+        self._awaiting_map = False
         self.dialog.grab_set()
-        print(f"[CONFIG DIALOG] grab_set() done: {(time.perf_counter() - _t0)*1000:.1f}ms")
 
         # Defer hotkey pause to after dialog is fully painted
         # Using after(50) + update() ensures widgets are rendered before the blocking pause
         if hasattr(self.parent, 'hotkey_manager'):
-            def pause_hotkeys():
-                self.dialog.update()  # Force full repaint before blocking pause
-                self.parent.hotkey_manager.pause()
-            self.dialog.after(50, pause_hotkeys)
-        print(f"[CONFIG DIALOG] __init__ complete: {(time.perf_counter() - _t0)*1000:.1f}ms")
+            self._pause_after_id = self.dialog.after(50, self._pause_hotkeys)
+
+    def _pause_hotkeys(self):
+        """Pause global hotkeys once the dialog has been painted."""
+        self._pause_after_id = None
+        self.dialog.update()  # Force full repaint before blocking pause
+        self.parent.hotkey_manager.pause()
+
+    def is_reusable(self):
+        """True if this (hidden) dialog can be shown again instead of building a new one."""
+        try:
+            exists = bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            exists = False
+        # Labels are translated at build time, so a language switch needs a rebuild
+        return exists and self._built_language == get_current_language()
+
+    def reopen(self):
+        """Re-seed the settings from config and show the hidden dialog again."""
+        self.load_current_settings()
+        # Panels hold widget state seeded from the old values, so build them afresh
+        self._discard_panels()
+        self._setup_styles()
+        self.switch_category("Recording")
+        # The main window may have moved since the dialog was last shown
+        self._center_on_parent()
+        self._show()
 
     def load_current_settings(self):
         """Load current configuration settings from settings.json."""
@@ -234,6 +309,37 @@ class ConfigDialog:
         """Create the main dialog layout."""
         _t0 = time.perf_counter()
 
+        self._setup_styles()
+        logger.debug("  - styles configured: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Create top frame for navigation and content
+        top_frame = ttk.Frame(main_frame)
+        top_frame.pack(fill=tk.BOTH, expand=True)
+        logger.debug("  - frames created: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+        # Create bottom frame for buttons
+        self.create_bottom_buttons(main_frame)
+        logger.debug("  - bottom buttons created: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+        # Create left navigation and right content areas in the top frame
+        self.create_navigation_panel(top_frame)
+        logger.debug("  - navigation panel created: %.1fms", (time.perf_counter() - _t0) * 1000)
+        self.create_content_panel(top_frame)
+        logger.debug("  - content panel created: %.1fms", (time.perf_counter() - _t0) * 1000)
+
+        # Initially show recording settings
+        self.switch_category(self.current_category)
+        logger.debug("  - recording settings shown: %.1fms", (time.perf_counter() - _t0) * 1000)
+        
+    def _setup_styles(self):
+        """Configure the dialog's ttk styles.
+
+        Called on every build and reopen: sv_ttk.set_theme resets style
+        configurations, so a theme toggle while the dialog is hidden drops them.
+        """
         # Check current theme for appropriate colors
         is_dark = self.config.dark_mode
 
@@ -263,30 +369,7 @@ class ConfigDialog:
                 background=[('!disabled', '#e0e0e0'), ('active', '#d0d0d0')],
                 foreground=[('!disabled', '#000000')]
             )
-        print(f"[CONFIG DIALOG]   - styles configured: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        main_frame = ttk.Frame(self.dialog, padding="10")
-        main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Create top frame for navigation and content
-        top_frame = ttk.Frame(main_frame)
-        top_frame.pack(fill=tk.BOTH, expand=True)
-        print(f"[CONFIG DIALOG]   - frames created: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Create bottom frame for buttons
-        self.create_bottom_buttons(main_frame)
-        print(f"[CONFIG DIALOG]   - bottom buttons created: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Create left navigation and right content areas in the top frame
-        self.create_navigation_panel(top_frame)
-        print(f"[CONFIG DIALOG]   - navigation panel created: {(time.perf_counter() - _t0)*1000:.1f}ms")
-        self.create_content_panel(top_frame)
-        print(f"[CONFIG DIALOG]   - content panel created: {(time.perf_counter() - _t0)*1000:.1f}ms")
-
-        # Initially show recording settings
-        self.show_recording_settings()
-        print(f"[CONFIG DIALOG]   - recording settings shown: {(time.perf_counter() - _t0)*1000:.1f}ms")
-        
     def create_navigation_panel(self, parent):
         """Create the left navigation panel."""
         self.nav_frame = ttk.LabelFrame(parent, text=_("Settings Categories"), padding="10", style='Dialog.TLabelframe')
@@ -294,74 +377,40 @@ class ConfigDialog:
 
         # Navigation buttons
         self.nav_buttons = {}
-
-        self.nav_buttons["Recording"] = ttk.Button(
-            self.nav_frame,
-            text=_("Recording"),
-            command=lambda: self.switch_category("Recording"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
-        )
-        self.nav_buttons["Recording"].pack(fill=tk.X, pady=2)
-
-        self.nav_buttons["Display"] = ttk.Button(
-            self.nav_frame,
-            text=_("Display"),
-            command=lambda: self.switch_category("Display"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
-        )
-        self.nav_buttons["Display"].pack(fill=tk.X, pady=2)
-
-        self.nav_buttons["Language"] = ttk.Button(
-            self.nav_frame,
-            text=_("Language"),
-            command=lambda: self.switch_category("Language"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
-        )
-        self.nav_buttons["Language"].pack(fill=tk.X, pady=2)
-
-        self.nav_buttons["Output"] = ttk.Button(
-            self.nav_frame,
-            text=_("Output"),
-            command=lambda: self.switch_category("Output"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
+        self._highlighted_category = None
+
+        # Labels are listed literally so gettext extraction still picks them up
+        categories = (
+            ("Recording", _("Recording")),
+            ("Display", _("Display")),
+            ("Language", _("Language")),
+            ("Output", _("Output")),
+            ("AI Models", _("AI Models")),
+            ("Behavior", _("Behavior")),
         )
-        self.nav_buttons["Output"].pack(fill=tk.X, pady=2)
-
-        self.nav_buttons["AI Models"] = ttk.Button(
-            self.nav_frame,
-            text=_("AI Models"),
-            command=lambda: self.switch_category("AI Models"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
-        )
-        self.nav_buttons["AI Models"].pack(fill=tk.X, pady=2)
-
-        self.nav_buttons["Behavior"] = ttk.Button(
-            self.nav_frame,
-            text=_("Behavior"),
-            command=lambda: self.switch_category("Behavior"),
-            width=15,
-            style='Nav.TButton',
-            cursor='hand2'
-        )
-        self.nav_buttons["Behavior"].pack(fill=tk.X, pady=2)
+        for name, label in categories:
+            button = ttk.Button(
+                self.nav_frame,
+                text=label,
+                command=partial(self.switch_category, name),
+                width=15,
+                style='Nav.TButton',
+                cursor='hand2'
+            )
+            button.pack(fill=tk.X, pady=2)
+            self.nav_buttons[name] = button
 
         # Highlight current selection
         self.update_navigation_highlight()
         
     def create_content_panel(self, parent):
         """Create the right content panel."""
-        self.content_frame = ttk.Frame(parent)
-        self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        self._content_area = ttk.Frame(parent)
+        self._content_area.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        # Category panels are built on first visit and then kept, hidden, until the
+        # dialog is re-seeded; content_frame always points at the panel being built
+        self._panels = {}
+        self.content_frame = self._content_area
         
     def create_bottom_buttons(self, parent):
         """Create the bottom button panel."""
@@ -371,8 +420,16 @@ class ConfigDialog:
         # Use half the button height for corner_radius to create pill shape
         button_height = get_button_height('dialog')
         corner_radius = button_height // 2
+        gap = get_spacing('sm')
 
         # Cancel and Save buttons (Cancel on left, Save on right)
+        # customtkinter is imported here rather than at module load; it is slow to import
+        # and only the dialogs use it
+        import customtkinter as ctk
+
+        # Both buttons share one font object rather than allocating a CTkFont each
+        button_font = ctk.CTkFont(family=get_font_family(), size=get_font_size('dialog_button'), weight='bold')
+
         cancel_button = ctk.CTkButton(
             button_frame,
             text=_("Cancel"),
@@ -381,13 +438,13 @@ class ConfigDialog:
             width=180,
             fg_color="#666666",
             hover_color="#444444",
-            font=ctk.CTkFont(family=get_font_family(), size=get_font_size('dialog_button'), weight='bold'),
+            font=button_font,
             cursor="hand2",
             command=self._close_dialog
         )
-        cancel_button.pack(side=tk.LEFT, padx=(0, get_spacing('sm')))
+        cancel_button.pack(side=tk.LEFT, padx=(0, gap))
 
-        save_button = ctk.CTkButton(
+        self.save_button = ctk.CTkButton(
             button_frame,
             text=_("Save Changes"),
             corner_radius=corner_radius,
@@ -395,45 +452,86 @@ class ConfigDialog:
             width=200,
             fg_color="#058705",
             hover_color="#046a38",
-            font=ctk.CTkFont(family=get_font_family(), size=get_font_size('dialog_button'), weight='bold'),
+            font=button_font,
             cursor="hand2",
             command=self.save_settings
         )
-        save_button.pack(side=tk.RIGHT, padx=(get_spacing('sm'), 0))
+        self.save_button.pack(side=tk.RIGHT, padx=(gap, 0))
+
+        # Inline save confirmation, shown briefly before the dialog closes
+        self.status_label = ttk.Label(
+            button_frame,
+            text="",
+            foreground="#046a38",
+            font=get_font('sm', 'bold')
+        )
+        self.status_label.pack(side=tk.RIGHT, padx=(gap, 0))
 
     def switch_category(self, category):
         """Switch to a different settings category."""
+        # Hide the current panel; it keeps its widgets (and any unsaved edits)
+        previous = self._panels.get(self.current_category)
+        if previous is not None:
+            previous.pack_forget()
+
         self.current_category = category
         self.update_navigation_highlight()
 
-        # Clear current content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Show appropriate settings
-        if category == "Recording":
-            self.show_recording_settings()
-        elif category == "Display":
-            self.show_display_settings()
-        elif category == "Language":
-            self.show_language_settings()
-        elif category == "Output":
-            self.show_output_settings()
-        elif category == "AI Models":
-            self.show_ai_models_settings()
-        elif category == "Behavior":
-            self.show_behavior_settings()
+        panel = self._panels.get(category)
+        if panel is None:
+            builders = {
+                "Recording": self.show_recording_settings,
+                "Display": self.show_display_settings,
+                "Language": self.show_language_settings,
+                "Output": self.show_output_settings,
+                "AI Models": self.show_ai_models_settings,
+                "Behavior": self.show_behavior_settings,
+            }
+            panel = ttk.Frame(self._content_area)
+            self._panels[category] = panel
+            # The show_* builders pack their widgets into self.content_frame
+            self.content_frame = panel
+            builders[category]()
+        panel.pack(fill=tk.BOTH, expand=True)
+
+    def _discard_panels(self):
+        """Destroy the built category panels so they are rebuilt from fresh settings."""
+        for panel in self._panels.values():
+            panel.destroy()
+        self._panels.clear()
             
     def update_navigation_highlight(self):
         """Update the visual highlight for the current navigation selection."""
-        for category, button in self.nav_buttons.items():
-            if category == self.current_category:
-                # Selected: bold text with accent background
-                button.configure(style='NavSelected.TButton')
-            else:
-                # Unselected: normal style
-                button.configure(style='Nav.TButton')
+        # Only the previously selected and newly selected buttons need restyling
+        previous = self._highlighted_category
+        if previous == self.current_category:
+            return
+        if previous in self.nav_buttons:
+            # Unselected: normal style
+            self.nav_buttons[previous]['style'] = 'Nav.TButton'
+        # Selected: bold text with accent background
+        self.nav_buttons[self.current_category]['style'] = 'NavSelected.TButton'
+        self._highlighted_category = self.current_category
                 
+    def _add_radio(self, parent, text, variable, value, description=None, command=None):
+        """Pack a dialog radio button, optionally followed by an indented description."""
+        ttk.Radiobutton(
+            parent,
+            text=text,
+            variable=variable,
+            value=value,
+            command=command,
+            style='Dialog.TRadiobutton'
+        ).pack(anchor="w", pady=2)
+
+        if description:
+            ttk.Label(
+                parent,
+                text=description,
+                font=get_font('xxs'),
+                foreground="#888888"
+            ).pack(anchor="w", padx=(20, 0), pady=(0, 8))
+
     def show_recording_settings(self):
         """Show the recording settings panel."""
         # Main title
@@ -460,38 +558,30 @@ class ConfigDialog:
         ).pack(anchor="w", pady=(0, 10))
 
         # Radio buttons for location options
-        ttk.Radiobutton(
+        self._add_radio(
             location_frame,
-            text=_("Alongside application (recommended)"),
-            variable=self.recording_location_var,
-            value="alongside",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Alongside application (recommended)"),
+            self.recording_location_var,
+            "alongside"
+        )
 
         # Get the appropriate AppData path based on OS
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             appdata_text = _("In AppData folder")
-        elif platform.system() == "Darwin":  # macOS
+        elif IS_MACOS:
             appdata_text = _("In Application Support folder")
         else:  # Linux
             appdata_text = _("In home config folder")
 
-        ttk.Radiobutton(
-            location_frame,
-            text=appdata_text,
-            variable=self.recording_location_var,
-            value="appdata",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+        self._add_radio(location_frame, appdata_text, self.recording_location_var, "appdata")
 
-        ttk.Radiobutton(
+        self._add_radio(
             location_frame,
-            text=_("Custom folder:"),
-            variable=self.recording_location_var,
-            value="custom",
-            command=self.on_custom_location_selected,
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Custom folder:"),
+            self.recording_location_var,
+            "custom",
+            command=self.on_custom_location_selected
+        )
 
         # Custom folder selection frame
         self.custom_folder_frame = ttk.Frame(location_frame)
@@ -500,7 +590,6 @@ class ConfigDialog:
         self.custom_path_entry = ttk.Entry(
             self.custom_folder_frame,
             textvariable=self.custom_location_var,
-            state="readonly" if self.recording_location_var.get() != "custom" else "normal",
             font=get_font('sm')
         )
         self.custom_path_entry.pack(side=tk.LEFT, fill="x", expand=True, padx=(0, 5))
@@ -509,7 +598,6 @@ class ConfigDialog:
             self.custom_folder_frame,
             text=_("Browse..."),
             command=self.browse_custom_folder,
-            state="disabled" if self.recording_location_var.get() != "custom" else "normal",
             style='Dialog.TButton',
             cursor='hand2'
         )
@@ -530,21 +618,19 @@ class ConfigDialog:
             style='Dialog.TLabel'
         ).pack(anchor="w", pady=(0, 10))
 
-        ttk.Radiobutton(
+        self._add_radio(
             handling_frame,
-            text=_("Overwrite the same file each time (saves disk space)"),
-            variable=self.file_handling_var,
-            value="overwrite",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Overwrite the same file each time (saves disk space)"),
+            self.file_handling_var,
+            "overwrite"
+        )
 
-        ttk.Radiobutton(
+        self._add_radio(
             handling_frame,
-            text=_("Save each recording with date/time in filename"),
-            variable=self.file_handling_var,
-            value="timestamp",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Save each recording with date/time in filename"),
+            self.file_handling_var,
+            "timestamp"
+        )
 
         # Warning for timestamp option
         warning_frame = ttk.Frame(handling_frame)
@@ -557,16 +643,26 @@ class ConfigDialog:
             foreground="#CC6600"
         ).pack(anchor="w")
 
-        # Bind radio button changes to update UI state
-        self.recording_location_var.trace("w", self.on_location_change)
-        
-    def on_location_change(self, *args):
+        # Custom folder controls are only editable while "custom" is selected
+        self._apply_custom_state(self.recording_location_var.get() == "custom")
+
+    def _schedule_location_update(self, *args):
+        """Coalesce recording location writes into one idle-time state update."""
+        if self._location_update_id is None:
+            self._location_update_id = self.dialog.after_idle(self.on_location_change)
+
+    def on_location_change(self):
         """Handle changes to the recording location selection."""
-        is_custom = self.recording_location_var.get() == "custom"
+        self._location_update_id = None
+        # The Recording panel may not be built yet, or was discarded on reopen
+        if not hasattr(self, 'custom_path_entry') or not self.custom_path_entry.winfo_exists():
+            return
+        self._apply_custom_state(self.recording_location_var.get() == "custom")
 
-        # Enable/disable custom path controls
-        self.custom_path_entry.configure(state="normal" if is_custom else "readonly")
-        self.browse_button.configure(state="normal" if is_custom else "disabled")
+    def _apply_custom_state(self, is_custom):
+        """Enable or disable the custom path controls."""
+        self.custom_path_entry['state'] = "normal" if is_custom else "readonly"
+        self.browse_button['state'] = "normal" if is_custom else "disabled"
 
     def show_output_settings(self):
         """Show the output settings panel."""
@@ -593,55 +689,49 @@ class ConfigDialog:
             style='Dialog.TLabel'
         ).pack(anchor="w", pady=(0, 10))
 
-        ttk.Radiobutton(
+        self._add_radio(
             paste_frame,
-            text=_("Auto (recommended) - Uses best method for your system"),
-            variable=self.paste_method_var,
-            value="auto",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Auto (recommended) - Uses best method for your system"),
+            self.paste_method_var,
+            "auto"
+        )
 
         # Windows-specific options
-        if platform.system() == "Windows":
-            ttk.Radiobutton(
+        if IS_WINDOWS:
+            self._add_radio(
                 paste_frame,
-                text=_("SendInput - Native Windows API (most reliable)"),
-                variable=self.paste_method_var,
-                value="sendinput",
-                style='Dialog.TRadiobutton'
-            ).pack(anchor="w", pady=2)
+                _("SendInput - Native Windows API (most reliable)"),
+                self.paste_method_var,
+                "sendinput"
+            )
 
-            ttk.Radiobutton(
+            self._add_radio(
                 paste_frame,
-                text=_("win32api - Older Windows API (keybd_event)"),
-                variable=self.paste_method_var,
-                value="win32api",
-                style='Dialog.TRadiobutton'
-            ).pack(anchor="w", pady=2)
+                _("win32api - Older Windows API (keybd_event)"),
+                self.paste_method_var,
+                "win32api"
+            )
 
-        ttk.Radiobutton(
+        self._add_radio(
             paste_frame,
-            text=_("pynput - Cross-platform with timing delays"),
-            variable=self.paste_method_var,
-            value="pynput",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("pynput - Cross-platform with timing delays"),
+            self.paste_method_var,
+            "pynput"
+        )
 
-        ttk.Radiobutton(
+        self._add_radio(
             paste_frame,
-            text=_("pynput (legacy) - Original method, no delays"),
-            variable=self.paste_method_var,
-            value="pynput_legacy",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("pynput (legacy) - Original method, no delays"),
+            self.paste_method_var,
+            "pynput_legacy"
+        )
 
-        ttk.Radiobutton(
+        self._add_radio(
             paste_frame,
-            text=_("pyautogui - Alternative automation library"),
-            variable=self.paste_method_var,
-            value="pyautogui",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("pyautogui - Alternative automation library"),
+            self.paste_method_var,
+            "pyautogui"
+        )
 
         # Info note
         info_frame = ttk.Frame(paste_frame)
@@ -680,53 +770,29 @@ class ConfigDialog:
         ).pack(anchor="w", pady=(0, 10))
 
         # Radio buttons for HiDPI options
-        ttk.Radiobutton(
+        self._add_radio(
             hidpi_frame,
-            text=_("Auto-detect (recommended)"),
-            variable=self.hidpi_mode_var,
-            value="auto",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
-
-        auto_description = ttk.Label(
-            hidpi_frame,
-            text=_("Automatically detect and apply appropriate scaling based on your display"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Auto-detect (recommended)"),
+            self.hidpi_mode_var,
+            "auto",
+            description=_("Automatically detect and apply appropriate scaling based on your display")
         )
-        auto_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
 
-        ttk.Radiobutton(
+        self._add_radio(
             hidpi_frame,
-            text=_("Force enabled"),
-            variable=self.hidpi_mode_var,
-            value="enabled",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
-
-        enabled_description = ttk.Label(
-            hidpi_frame,
-            text=_("Always apply HiDPI scaling (use if auto-detection doesn't work correctly)"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Force enabled"),
+            self.hidpi_mode_var,
+            "enabled",
+            description=_("Always apply HiDPI scaling (use if auto-detection doesn't work correctly)")
         )
-        enabled_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
-
-        ttk.Radiobutton(
-            hidpi_frame,
-            text=_("Disabled"),
-            variable=self.hidpi_mode_var,
-            value="disabled",
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
 
-        disabled_description = ttk.Label(
+        self._add_radio(
             hidpi_frame,
-            text=_("Never apply HiDPI scaling (use standard scaling)"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Disabled"),
+            self.hidpi_mode_var,
+            "disabled",
+            description=_("Never apply HiDPI scaling (use standard scaling)")
         )
-        disabled_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
 
         # Note about restart requirement
         note_frame = ttk.Frame(hidpi_frame)
@@ -765,37 +831,21 @@ class ConfigDialog:
         ).pack(anchor="w", pady=(0, 10))
 
         # Radio buttons for close behavior
-        ttk.Radiobutton(
+        self._add_radio(
             close_frame,
-            text=_("Close the application"),
-            variable=self.close_to_tray_var,
-            value=False,
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
-
-        close_description = ttk.Label(
-            close_frame,
-            text=_("Clicking X will close Quick Whisper completely"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Close the application"),
+            self.close_to_tray_var,
+            False,
+            description=_("Clicking X will close Quick Whisper completely")
         )
-        close_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
 
-        ttk.Radiobutton(
+        self._add_radio(
             close_frame,
-            text=_("Minimize to system tray"),
-            variable=self.close_to_tray_var,
-            value=True,
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
-
-        tray_description = ttk.Label(
-            close_frame,
-            text=_("Clicking X will hide the window to the system tray (use tray icon to restore)"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Minimize to system tray"),
+            self.close_to_tray_var,
+            True,
+            description=_("Clicking X will hide the window to the system tray (use tray icon to restore)")
         )
-        tray_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
 
     def show_language_settings(self):
         """Show the language settings panel."""
@@ -823,22 +873,14 @@ class ConfigDialog:
         ).pack(anchor="w", pady=(0, 10))
 
         # Radio buttons for language mode
-        ttk.Radiobutton(
+        self._add_radio(
             language_frame,
-            text=_("Auto-detect from system"),
-            variable=self.language_mode_var,
-            value="auto",
-            command=self._on_language_mode_change,
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
-
-        auto_description = ttk.Label(
-            language_frame,
-            text=_("Automatically detect language from your operating system settings"),
-            font=get_font('xxs'),
-            foreground="#888888"
+            _("Auto-detect from system"),
+            self.language_mode_var,
+            "auto",
+            description=_("Automatically detect language from your operating system settings"),
+            command=self._on_language_mode_change
         )
-        auto_description.pack(anchor="w", padx=(20, 0), pady=(0, 8))
 
         # Show detected language when auto is selected
         self.detected_lang_frame = ttk.Frame(language_frame)
@@ -860,14 +902,13 @@ class ConfigDialog:
         )
         self.detected_lang_value.pack(side=tk.LEFT, padx=(5, 0))
 
-        ttk.Radiobutton(
+        self._add_radio(
             language_frame,
-            text=_("Manual selection"),
-            variable=self.language_mode_var,
-            value="manual",
-            command=self._on_language_mode_change,
-            style='Dialog.TRadiobutton'
-        ).pack(anchor="w", pady=2)
+            _("Manual selection"),
+            self.language_mode_var,
+            "manual",
+            command=self._on_language_mode_change
+        )
 
         # Manual language selection frame
         self.manual_lang_frame = ttk.Frame(language_frame)
@@ -882,7 +923,8 @@ class ConfigDialog:
         # Get available languages from compiled translations
         available = get_available_languages()
 
-        # Language dropdown
+        # Language dropdown (codes kept in row order so selection maps back by index)
+        self._ui_language_codes = list(available)
         self.language_combo = ttk.Combobox(
             self.manual_lang_frame,
             values=[f"{name} ({code})" for code, name in available.items()],
@@ -932,17 +974,10 @@ class ConfigDialog:
             style='Dialog.TLabel'
         ).pack(anchor="w", pady=(0, 5))
 
-        # Prepare sorted language list with Auto Detect first
-        language_values = [(code, name) for code, name in self.languages.items()]
-        auto_option = next(item for item in language_values if item[0] == "auto")
-        language_values.remove(auto_option)
-        language_values.sort(key=lambda x: x[1])
-        language_values.insert(0, auto_option)
-
-        # AI Language combobox
+        # AI Language combobox (rows pre-sorted at module load, Auto Detect first)
         self.ai_language_combo = ttk.Combobox(
             ai_language_frame,
-            values=[f"{name} ({code})" for code, name in language_values],
+            values=_LANG_COMBO_VALUES,
             state="readonly",
             font=get_font('sm')
         )
@@ -950,8 +985,9 @@ class ConfigDialog:
 
         # Set current language value
         current_ai_lang = self.whisper_language_var.get()
-        current_ai_lang_name = self.languages.get(current_ai_lang, "Auto Detect")
-        self.ai_language_combo.set(f"{current_ai_lang_name} ({current_ai_lang})")
+        self.ai_language_combo.set(
+            _LANG_CODE_TO_DISPLAY.get(current_ai_lang, f"Auto Detect ({current_ai_lang})")
+        )
 
         ttk.Label(
             ai_language_frame,
@@ -974,11 +1010,9 @@ class ConfigDialog:
 
     def _on_manual_language_change(self, event=None):
         """Handle manual language selection change."""
-        selected = self.language_combo.get()
-        # Extract language code from "Display Name (code)" format
-        if "(" in selected and ")" in selected:
-            lang_code = selected.split("(")[-1].strip(")")
-            self.language_var.set(lang_code)
+        index = self.language_combo.current()
+        if index >= 0:
+            self.language_var.set(self._ui_language_codes[index])
 
     def show_ai_models_settings(self):
         """Show the AI models settings panel."""
@@ -1003,45 +1037,16 @@ class ConfigDialog:
         transcription_section = ttk.Frame(models_frame)
         transcription_section.pack(fill="x", pady=(0, 15))
 
-        ttk.Label(
+        (self.transcription_model_combo, self.custom_trans_frame,
+         self.custom_trans_entry) = self._build_model_picker(
             transcription_section,
-            text=_("Transcription Model:"),
-            style='Dialog.TLabel'
-        ).pack(anchor="w")
-
-        # Transcription model dropdown
-        dropdown_frame = ttk.Frame(transcription_section)
-        dropdown_frame.pack(fill="x", pady=(5, 0))
-
-        self.transcription_model_combo = ttk.Combobox(
-            dropdown_frame,
-            textvariable=self.transcription_model_var,
-            values=list(self.transcription_models.keys()),
-            state="readonly",
-            font=get_font('sm')
+            _("Transcription Model:"),
+            _TRANSCRIPTION_MODEL_KEYS,
+            self.transcription_model_var,
+            self.custom_transcription_model_var,
+            _("Enter custom transcription model name:"),
+            label_pady=0
         )
-        self.transcription_model_combo.pack(fill="x")
-
-        # Custom transcription model input frame
-        self.custom_trans_frame = ttk.Frame(transcription_section)
-        ttk.Label(
-            self.custom_trans_frame,
-            text=_("Enter custom transcription model name:"),
-            style='Dialog.TLabel'
-        ).pack(anchor="w")
-        self.custom_trans_entry = ttk.Entry(
-            self.custom_trans_frame,
-            textvariable=self.custom_transcription_model_var,
-            font=get_font('sm')
-        )
-        self.custom_trans_entry.pack(fill="x", pady=(2, 0))
-
-        # Show custom frame if "other" selected
-        if self.transcription_model_var.get() == "other":
-            self.custom_trans_frame.pack(fill="x", pady=(5, 0))
-
-        # Bind transcription model change
-        self.transcription_model_var.trace_add("write", self._on_transcription_model_change)
 
         # Model type info
         ttk.Label(
@@ -1052,44 +1057,16 @@ class ConfigDialog:
         ).pack(anchor="w", pady=(8, 0))
 
         # --- LLM Model Section ---
-        ttk.Label(
+        (self.llm_model_combo, self.custom_llm_frame,
+         self.custom_llm_entry) = self._build_model_picker(
             models_frame,
-            text=_("OpenAI Copyediting Model:"),
-            style='Dialog.TLabel'
-        ).pack(anchor="w", pady=(5, 0))
-
-        llm_dropdown_frame = ttk.Frame(models_frame)
-        llm_dropdown_frame.pack(fill="x", pady=(5, 0))
-
-        self.llm_model_combo = ttk.Combobox(
-            llm_dropdown_frame,
-            textvariable=self.llm_model_var,
-            values=self.llm_models,
-            state="readonly",
-            font=get_font('sm')
-        )
-        self.llm_model_combo.pack(fill="x")
-
-        # Custom LLM model input frame
-        self.custom_llm_frame = ttk.Frame(models_frame)
-        ttk.Label(
-            self.custom_llm_frame,
-            text=_("Enter custom copyediting model name:"),
-            style='Dialog.TLabel'
-        ).pack(anchor="w")
-        self.custom_llm_entry = ttk.Entry(
-            self.custom_llm_frame,
-            textvariable=self.custom_llm_model_var,
-            font=get_font('sm')
+            _("OpenAI Copyediting Model:"),
+            LLM_MODELS,
+            self.llm_model_var,
+            self.custom_llm_model_var,
+            _("Enter custom copyediting model name:"),
+            label_pady=(5, 0)
         )
-        self.custom_llm_entry.pack(fill="x", pady=(2, 0))
-
-        # Show custom frame if "other" selected
-        if self.llm_model_var.get() == "other":
-            self.custom_llm_frame.pack(fill="x", pady=(5, 0))
-
-        # Bind LLM model change
-        self.llm_model_var.trace_add("write", self._on_llm_model_change)
 
         # Model info
         ttk.Label(
@@ -1112,29 +1089,85 @@ class ConfigDialog:
         link.bind("<Enter>", lambda e: link.config(fg=THEME_ACCENT_HOVER))
         link.bind("<Leave>", lambda e: link.config(fg=THEME_ACCENT))
 
-    def _on_transcription_model_change(self, *args):
-        """Handle transcription model dropdown change."""
-        if hasattr(self, 'custom_trans_frame'):
-            if self.transcription_model_var.get() == "other":
-                self.custom_trans_frame.pack(fill="x", pady=(5, 0))
-                if hasattr(self, 'custom_trans_entry'):
-                    self.custom_trans_entry.focus()
-            else:
-                self.custom_trans_frame.pack_forget()
-
-    def _on_llm_model_change(self, *args):
-        """Handle LLM model dropdown change."""
-        if hasattr(self, 'custom_llm_frame'):
-            if self.llm_model_var.get() == "other":
-                self.custom_llm_frame.pack(fill="x", pady=(5, 0))
-                if hasattr(self, 'custom_llm_entry'):
-                    self.custom_llm_entry.focus()
-            else:
-                self.custom_llm_frame.pack_forget()
+    def _build_model_picker(self, parent, label, values, var, custom_var, custom_label, label_pady):
+        """Build a model dropdown with its hidden "other" entry; returns (combo, custom_frame, custom_entry)."""
+        ttk.Label(
+            parent,
+            text=label,
+            style='Dialog.TLabel'
+        ).pack(anchor="w", pady=label_pady)
+
+        dropdown_frame = ttk.Frame(parent)
+        dropdown_frame.pack(fill="x", pady=(5, 0))
+
+        combo = ttk.Combobox(
+            dropdown_frame,
+            textvariable=var,
+            values=values,
+            state="readonly",
+            font=get_font('sm')
+        )
+        combo.pack(fill="x")
+
+        # Custom model input frame
+        custom_frame = ttk.Frame(parent)
+        ttk.Label(
+            custom_frame,
+            text=custom_label,
+            style='Dialog.TLabel'
+        ).pack(anchor="w")
+        custom_entry = ttk.Entry(
+            custom_frame,
+            textvariable=custom_var,
+            font=get_font('sm')
+        )
+        custom_entry.pack(fill="x", pady=(2, 0))
+
+        # Show custom frame if "other" selected
+        if var.get() == "other":
+            custom_frame.pack(fill="x", pady=(5, 0))
+
+        # React to user selection only; a variable trace would also fire on
+        # programmatic sets and pile up each time this panel is rebuilt
+        combo.bind("<<ComboboxSelected>>", self._on_model_change)
+
+        return combo, custom_frame, custom_entry
+
+    def _on_model_change(self, event=None):
+        """Handle a transcription or LLM model dropdown change."""
+        self._schedule_model_layout()
+
+    def _schedule_model_layout(self):
+        """Queue one idle-time layout pass for the custom model entries."""
+        # Several selections before the next idle cycle share a single pack pass
+        if not self._pending_model_layout:
+            self._pending_model_layout = True
+            self.dialog.after_idle(self._apply_model_layout)
+
+    def _apply_model_layout(self):
+        """Show or hide the custom model entries to match the dropdowns."""
+        self._pending_model_layout = False
+        # The panel may have been switched away before the idle callback ran
+        if not self.custom_trans_frame.winfo_exists():
+            return
+        for var, frame, entry in (
+            (self.transcription_model_var, self.custom_trans_frame, self.custom_trans_entry),
+            (self.llm_model_var, self.custom_llm_frame, self.custom_llm_entry),
+        ):
+            if var.get() == "other":
+                if not frame.winfo_manager():
+                    frame.pack(fill="x", pady=(5, 0))
+                    entry.focus()
+            elif frame.winfo_manager():
+                frame.pack_forget()
 
     def on_custom_location_selected(self):
         """Handle when custom location radio button is selected."""
-        # If no custom path is set and custom is selected, open browse dialog
+        # Let the radio button redraw before the native picker's nested modal loop starts
+        self.dialog.after_idle(self._maybe_browse)
+
+    def _maybe_browse(self):
+        """Open the browse dialog if custom is selected but no path is set yet."""
         if not self.custom_location_var.get().strip():
             self.browse_custom_folder()
             
@@ -1142,7 +1175,7 @@ class ConfigDialog:
         """Open a folder selection dialog."""
         folder_path = filedialog.askdirectory(
             title=_("Select Recording Folder"),
-            initialdir=self.custom_location_var.get() or os.path.expanduser("~")
+            initialdir=self.custom_location_var.get() or _HOME
         )
         
         if folder_path:
@@ -1150,8 +1183,15 @@ class ConfigDialog:
             
     def save_settings(self):
         """Save the configuration settings to settings.json."""
+        # Filesystem checks only matter when the recording location actually changes;
+        # they can be slow on network drives and run on the Tk thread
+        location_changed = (
+            (self.recording_location_var.get(), self.custom_location_var.get())
+            != (self.config.recording_location, self.config.custom_recording_path)
+        )
+
         # Validate custom path if selected
-        if self.recording_location_var.get() == "custom":
+        if location_changed and self.recording_location_var.get() == "custom":
             custom_path = self.custom_location_var.get().strip()
             if not custom_path:
                 messagebox.showerror(_("Error"), _("Please select a custom folder path"))
@@ -1176,9 +1216,13 @@ class ConfigDialog:
 
         # Validate AI Models settings
         # Get selected AI language code from combo box (if Language category was visited)
-        if hasattr(self, 'ai_language_combo'):
-            selected_language = self.ai_language_combo.get()
-            whisper_language_code = selected_language.split('(')[-1].strip(')')
+        if hasattr(self, 'ai_language_combo') and self.ai_language_combo.winfo_exists():
+            # Map the selected row back to its code; no parsing of the display text
+            index = self.ai_language_combo.current()
+            if index >= 0:
+                whisper_language_code = _LANG_ITEMS[index][0]
+            else:
+                whisper_language_code = self.whisper_language_var.get()
         else:
             whisper_language_code = self.whisper_language_var.get()
 
@@ -1225,16 +1269,11 @@ class ConfigDialog:
             self.config.save_settings()
 
             # Update parent's recording directory
-            self.parent.update_recording_directory()
-
-            # Update parent's AI model instance variables
-            self.parent.whisper_language = whisper_language_code
-            self.parent.transcription_model = transcription_model
-            self.parent.transcription_model_type = model_type
-            self.parent.ai_model = llm_model
+            if location_changed:
+                self.parent.update_recording_directory()
 
-            # Update the model label in the UI
-            self.parent.update_model_label()
+            # Hand the AI model settings to the parent; it refreshes the model label itself
+            self.parent.apply_model_settings(transcription_model, model_type, llm_model, whisper_language_code)
 
             # Apply close-to-tray setting immediately
             self.parent.update_close_behavior()
@@ -1247,7 +1286,9 @@ class ConfigDialog:
                 resolved_lang = detect_os_locale()
             else:
                 resolved_lang = new_lang
-            set_language(resolved_lang)
+            # Re-translating every registered widget is only needed on an actual change
+            if resolved_lang != get_current_language():
+                set_language(resolved_lang)
 
             # If HiDPI changed, prompt for restart
             if hidpi_changed:
@@ -1270,15 +1311,34 @@ class ConfigDialog:
                     self._close_dialog()
                     return
 
-            messagebox.showinfo(_("Success"), _("Configuration settings saved and applied successfully!"))
-            self._close_dialog()
+            # Confirm inline rather than with another modal popup, then close
+            self.status_label['text'] = _("Settings Saved")
+            self.save_button.configure(state="disabled")
+            self._close_after_id = self.dialog.after(SAVED_CLOSE_DELAY_MS, self._close_dialog)
 
         except Exception as e:
             messagebox.showerror(_("Error"), _("Could not save settings: {error}").format(error=e)) 
 
     def _close_dialog(self):
+        # Hidden rather than destroyed so the next open can reuse the built widgets
+        self._awaiting_map = False
+        if self._location_update_id is not None:
+            self.dialog.after_cancel(self._location_update_id)
+            self._location_update_id = None
+        # Closed before the deferred pause ran: cancel it, or hotkeys would stay paused
+        if self._pause_after_id is not None:
+            self.dialog.after_cancel(self._pause_after_id)
+            self._pause_after_id = None
+        # A pending close after a save must not hide the dialog once it is reopened
+        if self._close_after_id is not None:
+            self.dialog.after_cancel(self._close_after_id)
+            self._close_after_id = None
         try:
-            self.dialog.destroy()
+            self.dialog.grab_release()
+            self.dialog.withdraw()
+            # Reset the save confirmation for the next open
+            self.status_label['text'] = ""
+            self.save_button.configure(state="normal")
         finally:
             if hasattr(self.parent, 'hotkey_manager'):
                 self.parent.hotkey_manager.resume()
\ No newline at end of file
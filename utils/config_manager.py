@@ -52,7 +52,13 @@ class ConfigManager:
         "recording": {
             "location": "alongside",
             "custom_path": "",
-            "file_handling": "overwrite"
+            "file_handling": "overwrite",
+            # Capture buffer size in frames (64 ms at 16 kHz). Smaller buffers cut
+            # the audio lost when a stop aborts the stream, at more callbacks per second
+            "frames_per_buffer": 1024,
+            # Recordings stop and transcribe automatically after this many seconds
+            # (16 kHz mono PCM is ~1.9 MB a minute); 0 disables the cap
+            "max_seconds": 1800
         },
         "behavior": {
             "auto_hotkey_refresh": True,
@@ -68,6 +74,26 @@ class ConfigManager:
         "openai_api_key_encrypted": False
     }
     
+    # Legacy .env keys migrated into settings: KEY -> (section, setting, is_bool)
+    _ENV_SETTING_KEYS = {
+        "TRANSCRIPTION_MODEL": ("models", "transcription_model", False),
+        "TRANSCRIPTION_MODEL_TYPE": ("models", "transcription_model_type", False),
+        "AI_MODEL": ("models", "ai_model", False),
+        "WHISPER_LANGUAGE": ("models", "whisper_language", False),
+        "HIDE_BANNER": ("ui", "hide_banner", True),
+        "SELECTED_PROMPT": ("ui", "selected_prompt", False),
+        "SHORTCUT_RECORD_EDIT": ("shortcuts", "record_edit", False),
+        "SHORTCUT_RECORD_TRANSCRIBE": ("shortcuts", "record_transcribe", False),
+        "SHORTCUT_CANCEL_RECORDING": ("shortcuts", "cancel_recording", False),
+        "SHORTCUT_CYCLE_PROMPT_BACK": ("shortcuts", "cycle_prompt_back", False),
+        "SHORTCUT_CYCLE_PROMPT_FORWARD": ("shortcuts", "cycle_prompt_forward", False),
+        "RECORDING_LOCATION": ("recording", "location", False),
+        "CUSTOM_RECORDING_PATH": ("recording", "custom_path", False),
+        "FILE_HANDLING": ("recording", "file_handling", False),
+        "AUTO_HOTKEY_REFRESH": ("behavior", "auto_hotkey_refresh", True),
+        "AUTO_UPDATE_CHECK": ("behavior", "auto_update_check", True),
+    }
+    
     # Hardcoded encryption key components (not ideal, but better than plaintext)
     # In a production app, this would be derived from machine-specific info or user password
     _ENCRYPTION_SALT = b'QuickWhisper_Salt_2024'
@@ -94,6 +120,8 @@ class ConfigManager:
         # Load or migrate configuration
         self._settings: dict = {}
         self._credentials: dict = {}
+        # Last JSON text read from / written to each file, so unchanged saves skip the disk
+        self._saved_text: dict = {}
         self._load_config()
     
     def _set_os_specific_defaults(self):
@@ -156,68 +184,35 @@ class ConfigManager:
         """Migrate settings from legacy .env file to new JSON format."""
         print("Migrating configuration from .env to JSON format...")
         
-        env_vars = {}
+        # Build settings from env vars in a single pass over the file, applying each
+        # known key as it is read (later duplicates win, as before)
+        self._settings = self._deep_copy(self.DEFAULT_SETTINGS)
+        api_key = ""
         try:
             with open(self.legacy_env_path, 'r') as f:
                 for line in f:
                     line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip()
+                    if not line or line.startswith('#') or '=' not in line:
+                        continue
+                    key, value = line.split('=', 1)
+                    key, value = key.strip(), value.strip()
+                    if not value:
+                        continue
+                    if key == "OPENAI_API_KEY":
+                        api_key = value
+                    elif key in self._ENV_SETTING_KEYS:
+                        section, name, is_bool = self._ENV_SETTING_KEYS[key]
+                        self._settings[section][name] = value.lower() == "true" if is_bool else value
         except Exception as e:
             print(f"Error reading .env file: {e}")
-            env_vars = {}
-        
-        # Build settings from env vars
-        self._settings = self._deep_copy(self.DEFAULT_SETTINGS)
-        
-        # Models
-        if env_vars.get("TRANSCRIPTION_MODEL"):
-            self._settings["models"]["transcription_model"] = env_vars["TRANSCRIPTION_MODEL"]
-        if env_vars.get("TRANSCRIPTION_MODEL_TYPE"):
-            self._settings["models"]["transcription_model_type"] = env_vars["TRANSCRIPTION_MODEL_TYPE"]
-        if env_vars.get("AI_MODEL"):
-            self._settings["models"]["ai_model"] = env_vars["AI_MODEL"]
-        if env_vars.get("WHISPER_LANGUAGE"):
-            self._settings["models"]["whisper_language"] = env_vars["WHISPER_LANGUAGE"]
-        
-        # UI
-        if env_vars.get("HIDE_BANNER"):
-            self._settings["ui"]["hide_banner"] = env_vars["HIDE_BANNER"].lower() == "true"
-        if env_vars.get("SELECTED_PROMPT"):
-            self._settings["ui"]["selected_prompt"] = env_vars["SELECTED_PROMPT"]
-        
-        # Shortcuts
-        if env_vars.get("SHORTCUT_RECORD_EDIT"):
-            self._settings["shortcuts"]["record_edit"] = env_vars["SHORTCUT_RECORD_EDIT"]
-        if env_vars.get("SHORTCUT_RECORD_TRANSCRIBE"):
-            self._settings["shortcuts"]["record_transcribe"] = env_vars["SHORTCUT_RECORD_TRANSCRIBE"]
-        if env_vars.get("SHORTCUT_CANCEL_RECORDING"):
-            self._settings["shortcuts"]["cancel_recording"] = env_vars["SHORTCUT_CANCEL_RECORDING"]
-        if env_vars.get("SHORTCUT_CYCLE_PROMPT_BACK"):
-            self._settings["shortcuts"]["cycle_prompt_back"] = env_vars["SHORTCUT_CYCLE_PROMPT_BACK"]
-        if env_vars.get("SHORTCUT_CYCLE_PROMPT_FORWARD"):
-            self._settings["shortcuts"]["cycle_prompt_forward"] = env_vars["SHORTCUT_CYCLE_PROMPT_FORWARD"]
-        
-        # Recording
-        if env_vars.get("RECORDING_LOCATION"):
-            self._settings["recording"]["location"] = env_vars["RECORDING_LOCATION"]
-        if env_vars.get("CUSTOM_RECORDING_PATH"):
-            self._settings["recording"]["custom_path"] = env_vars["CUSTOM_RECORDING_PATH"]
-        if env_vars.get("FILE_HANDLING"):
-            self._settings["recording"]["file_handling"] = env_vars["FILE_HANDLING"]
-        
-        # Behavior
-        if env_vars.get("AUTO_HOTKEY_REFRESH"):
-            self._settings["behavior"]["auto_hotkey_refresh"] = env_vars["AUTO_HOTKEY_REFRESH"].lower() == "true"
-        if env_vars.get("AUTO_UPDATE_CHECK"):
-            self._settings["behavior"]["auto_update_check"] = env_vars["AUTO_UPDATE_CHECK"].lower() == "true"
+            self._settings = self._deep_copy(self.DEFAULT_SETTINGS)
+            api_key = ""
         
         # Build credentials from env vars (store encrypted)
         self._credentials = self._deep_copy(self.DEFAULT_CREDENTIALS)
-        if env_vars.get("OPENAI_API_KEY"):
+        if api_key:
             # Encrypt the API key during migration
-            self._credentials["openai_api_key"] = self._encrypt_value(env_vars["OPENAI_API_KEY"])
+            self._credentials["openai_api_key"] = self._encrypt_value(api_key)
             self._credentials["openai_api_key_encrypted"] = True
         
         # Save to new format
@@ -238,8 +233,9 @@ class ConfigManager:
         """Load settings from JSON file."""
         if self.settings_path.exists():
             try:
-                with open(self.settings_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                text = self.settings_path.read_text(encoding='utf-8')
+                loaded = json.loads(text)
+                self._saved_text[self.settings_path] = text
                 # Merge with defaults to handle any new settings
                 self._settings = self._merge_with_defaults(loaded, self.DEFAULT_SETTINGS)
             except Exception as e:
@@ -252,8 +248,9 @@ class ConfigManager:
         """Load credentials from JSON file and encrypt if necessary."""
         if self.credentials_path.exists():
             try:
-                with open(self.credentials_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                text = self.credentials_path.read_text(encoding='utf-8')
+                loaded = json.loads(text)
+                self._saved_text[self.credentials_path] = text
                 self._credentials = self._merge_with_defaults(loaded, self.DEFAULT_CREDENTIALS)
             except Exception as e:
                 print(f"Error loading credentials: {e}")
@@ -299,12 +296,26 @@ class ConfigManager:
         else:
             return obj
     
+    def _write_json(self, path: Path, data: dict):
+        """Atomically write data as JSON, skipping the write if the file already matches.
+
+        The JSON is written to a temp file and swapped in with os.replace, so a crash or
+        a concurrent read never sees a truncated file.
+        """
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+        if self._saved_text.get(path) == text:
+            return
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        self._saved_text[path] = text
+    
     def save_settings(self):
         """Save settings to JSON file."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            self._write_json(self.settings_path, self._settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
             raise
@@ -312,9 +323,7 @@ class ConfigManager:
     def save_credentials(self):
         """Save credentials to JSON file."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.credentials_path, 'w', encoding='utf-8') as f:
-                json.dump(self._credentials, f, indent=2, ensure_ascii=False)
+            self._write_json(self.credentials_path, self._credentials)
         except Exception as e:
             print(f"Error saving credentials: {e}")
             raise
@@ -472,6 +481,22 @@ class ConfigManager:
     @file_handling.setter
     def file_handling(self, value: str):
         self._settings["recording"]["file_handling"] = value
+
+    @property
+    def audio_frames_per_buffer(self) -> int:
+        return self._settings["recording"].get("frames_per_buffer", 1024)
+
+    @audio_frames_per_buffer.setter
+    def audio_frames_per_buffer(self, value: int):
+        self._settings["recording"]["frames_per_buffer"] = value
+
+    @property
+    def max_recording_seconds(self) -> int:
+        return self._settings["recording"].get("max_seconds", 1800)
+
+    @max_recording_seconds.setter
+    def max_recording_seconds(self, value: int):
+        self._settings["recording"]["max_seconds"] = value
     
     # Behavior
     @property
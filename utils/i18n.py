@@ -21,6 +21,7 @@ Usage:
     register_widget(label, 'text', 'settings.title')
 """
 
+import functools
 import gettext
 import locale
 import os
@@ -101,6 +102,9 @@ _current_language: str = "en"
 _translations: Optional[gettext.GNUTranslations] = None
 _null_translations = gettext.NullTranslations()
 
+# Parsed .mo catalogs by language code, so switching back to a language doesn't re-read it
+_catalog_cache: Dict[str, gettext.GNUTranslations] = {}
+
 # Widget registry for runtime refresh
 # Structure: [(widget, property_name, msgid, is_plural, plural_n), ...]
 _widget_registry: List[Tuple[Any, str, str, bool, Optional[Callable[[], int]]]] = []
@@ -109,11 +113,13 @@ _widget_registry: List[Tuple[Any, str, str, bool, Optional[Callable[[], int]]]]
 _refresh_callbacks: List[Callable[[], None]] = []
 
 
+@functools.lru_cache(maxsize=None)
 def get_locale_dir() -> Path:
     """
     Get the locale directory path, handling both development and packaged builds.
 
-    Returns the path to the locale directory containing .mo files.
+    Returns the path to the locale directory containing .mo files. The result is
+    cached since the install location can't change while the app is running.
     """
     # Check if running as a PyInstaller bundle
     if getattr(sys, 'frozen', False):
@@ -266,6 +272,10 @@ def load_translations(lang_code: str) -> Optional[gettext.GNUTranslations]:
     if lang_code == "en":
         return None  # English uses fallback (original strings)
 
+    cached = _catalog_cache.get(lang_code)
+    if cached is not None:
+        return cached
+
     locale_dir = get_locale_dir()
     mo_path = locale_dir / lang_code / "LC_MESSAGES" / f"{DOMAIN}.mo"
 
@@ -274,10 +284,12 @@ def load_translations(lang_code: str) -> Optional[gettext.GNUTranslations]:
         return None
 
     try:
+        # Only the compiled .mo is read at runtime; .po files are never parsed here
         with open(mo_path, 'rb') as f:
             translations = gettext.GNUTranslations(f)
-            logger.info(f"Loaded translations for '{lang_code}'")
-            return translations
+        _catalog_cache[lang_code] = translations
+        logger.info(f"Loaded translations for '{lang_code}'")
+        return translations
     except Exception as e:
         logger.error(f"Failed to load translations for '{lang_code}': {e}")
         return None
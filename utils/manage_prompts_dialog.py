@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 from pathlib import Path
-import customtkinter as ctk
 from utils.theme import get_font, get_font_size, get_font_family, get_window_size, get_button_height, get_spacing
 from utils.i18n import _
 
@@ -177,6 +176,8 @@ class ManagePromptsDialog:
 
         # Use half the button height for corner_radius to create pill shape
         button_height = get_button_height('dialog')
+        import customtkinter as ctk
+
         save_button = ctk.CTkButton(
             bottom_frame,
             text=_("Save Selection and Exit"),
@@ -6,7 +6,6 @@ and return the appropriate platform-specific implementations.
 """
 import platform
 import subprocess
-import webbrowser
 
 
 def get_platform():
@@ -160,6 +159,8 @@ def open_url(url):
             print(f"Failed to open URL via WSL interop: {e}")
             return False
     else:
+        # Only needed when a link is clicked, so keep it off the startup path
+        import webbrowser
         try:
             webbrowser.open(url)
             return True
@@ -6,7 +6,6 @@ for managing global keyboard hotkeys across different platforms.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import customtkinter as ctk
 from abc import ABC, abstractmethod
 from pathlib import Path
 import threading
@@ -333,6 +332,8 @@ class HotkeyManagerBase(ABC):
         button_height = get_button_height('dialog')
         corner_radius = button_height // 2
 
+        import customtkinter as ctk
+
         refresh_button = ctk.CTkButton(
             button_frame,
             text="Refresh Shortcuts",
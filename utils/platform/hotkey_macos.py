@@ -55,9 +55,9 @@ class MacOSHotkeyManager(HotkeyManagerBase):
             # Build hotkey mappings
             self._registered_hotkeys = {
                 self._normalize_shortcut(self.shortcuts['record_edit']):
-                    lambda: self.parent.after(0, lambda: self.parent.toggle_recording("edit")),
+                    lambda: self.parent.after(0, self.parent.toggle_recording, "edit"),
                 self._normalize_shortcut(self.shortcuts['record_transcribe']):
-                    lambda: self.parent.after(0, lambda: self.parent.toggle_recording("transcribe")),
+                    lambda: self.parent.after(0, self.parent.toggle_recording, "transcribe"),
                 self._normalize_shortcut(self.shortcuts['cancel_recording']):
                     lambda: self.parent.after(0, self.parent.cancel_recording),
                 self._normalize_shortcut(self.shortcuts['cycle_prompt_back']):
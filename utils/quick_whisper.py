@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, Menu
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import pyaudio
 import wave
 import os
@@ -10,7 +11,6 @@ import pyperclip
 import json
 import pyttsx3
 from tkinter import filedialog
-import customtkinter as ctk
 from PIL import Image, ImageTk 
 from openai import OpenAI
 from utils.config_manager import get_config
@@ -54,6 +54,13 @@ class QuickWhisper(tk.Tk):
 
         self.is_mac = platform.system() == 'Darwin'
 
+        # Base directory for bundled assets, resolved once (see resource_path)
+        try:
+            self._resource_base = sys._MEIPASS
+        except AttributeError:
+            self._resource_base = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self._resource_paths = {}
+
         # Apply HiDPI scaling for better display on high-resolution monitors
         self._apply_hidpi_scaling()
 
@@ -142,6 +149,10 @@ class QuickWhisper(tk.Tk):
         self.max_history_length = 10000
         self.current_button_mode = "transcribe" # "transcribe" or "edit"
         
+        # Single long-lived worker for saving + transcribing recordings. Bounding it to one
+        # thread serialises back-to-back recordings instead of racing them against each other.
+        self._work_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+
         # Initialize recording directory based on settings
         self.update_recording_directory()
         
@@ -697,6 +708,7 @@ class QuickWhisper(tk.Tk):
         self.settings_menu.add_separator()
         self.settings_menu.add_command(label=_("Keyboard Shortcut Mapping"), command=self.check_keyboard_shortcuts)
         self.settings_menu.add_command(label=_("Refresh Hotkeys"), command=self.hotkey_manager.force_hotkey_refresh)
+        self.settings_menu.add_command(label=_("Refresh Audio Devices"), command=self.refresh_audio_devices)
 
         # Actions Menu - use styled popup menu for modern look
         self.actions_menu = StyledPopupMenu(self)
@@ -788,27 +800,53 @@ class QuickWhisper(tk.Tk):
 
     def stop_recording(self):
         """Stop recording and process audio."""
-        audio_file = self.audio_manager.stop_recording()
+        audio_file, frames = self.audio_manager.stop_recording()
         if audio_file:
-            # Start transcription in a separate thread
-            threading.Thread(target=self.transcribe_audio).start()
+            # Write the WAV and transcribe on the work pool so the UI is not blocked.
+            # Path and frames travel with the job: a later stop queued behind it
+            # must not be able to swap them out before it runs
+            self._work_pool.submit(self._finalise_and_transcribe, audio_file, frames)
+
+    def _finalise_and_transcribe(self, audio_file, frames):
+        """Write a stopped recording to disk, then transcribe it (worker thread)."""
+        try:
+            self.audio_manager.write_audio_file(audio_file, frames)
+        except Exception as e:
+            print(f"Error saving recording: {e}")
+            self.ui_manager.set_status("Error saving recording", "red")
+            self.after(0, messagebox.showerror, "Recording error", f"Could not save the recording: {e}")
+            return
+        self.transcribe_audio(audio_file)
+
+    def retranscribe(self, file_path):
+        """Queue a fresh transcription of an existing recording on the work pool."""
+        self._work_pool.submit(self.transcribe_audio, file_path)
             
     def cancel_recording(self):
         """Cancel the current recording without processing."""
         self.audio_manager.cancel_recording()
         self.hotkey_manager.update_shortcut_displays()
     
+    def refresh_audio_devices(self):
+        """Rescan audio input devices (e.g. after plugging in a microphone)."""
+        self.ui_manager.refresh_input_devices()
+
     def retry_last_recording(self):
         """Retry processing the last recording."""
         self.audio_manager.retry_last_recording()
 
-    def transcribe_audio(self):
-        file_path = self.audio_manager.audio_file
+    def _set_transcription_text(self, text):
+        """Replace the transcription box contents (Tk thread only)."""
+        self.ui_manager.transcription_text.delete("1.0", tk.END)
+        self.ui_manager.transcription_text.insert("1.0", text)
+
+    def transcribe_audio(self, file_path):
 
         try:
             self.ui_manager.set_status("Processing - Transcript...", "green")
 
-            with open(str(file_path), "rb") as audio_file:
+            # Compressed to Ogg/Opus when ffmpeg is available to cut upload time
+            with self.audio_manager.open_for_upload(file_path) as audio_file:
 
                 print(f"Transcription Mode: '{self.transcription_model}' | Type: '{self.transcription_model_type}'")
                 
@@ -858,14 +896,9 @@ class QuickWhisper(tk.Tk):
             if self.current_button_mode == "edit":
                 print("AI Editing Transcription")
 
-                # Helper to update UI safely from this thread
-                def update_transcription_ui(text):
-                    self.ui_manager.transcription_text.delete("1.0", tk.END)
-                    self.ui_manager.transcription_text.insert("1.0", text)
-
                 # set input box to transcription text first, just incase there is a failure
                 # Schedule UI update on main thread (Tkinter is not thread-safe)
-                self.after(0, lambda: update_transcription_ui(transcription_text))
+                self.after(0, self._set_transcription_text, transcription_text)
 
                 # Then GPT edit that transcribed text and insert
                 self.ui_manager.set_status("Processing - AI Editing...", "green")
@@ -878,14 +911,11 @@ class QuickWhisper(tk.Tk):
                 play_text = edited_text
 
                 # Schedule UI update on main thread (Tkinter is not thread-safe)
-                self.after(0, lambda: update_transcription_ui(play_text))
+                self.after(0, self._set_transcription_text, play_text)
             else:
                 print("Outputting Raw Transcription Only")
                 # Schedule UI update on main thread (Tkinter is not thread-safe)
-                def update_transcription_ui(text):
-                    self.ui_manager.transcription_text.delete("1.0", tk.END)
-                    self.ui_manager.transcription_text.insert("1.0", text)
-                self.after(0, lambda: update_transcription_ui(transcription_text))
+                self.after(0, self._set_transcription_text, transcription_text)
                 play_text = transcription_text
 
 
@@ -897,11 +927,11 @@ class QuickWhisper(tk.Tk):
 
             print("Transcription Complete: The audio has been transcribed and the text has been placed in the input area.")
             # Play stop recording sound
-            self.audio_manager._sound_pool.submit(self.play_sound, "assets/double-pop-down.wav")
+            self.audio_manager.play_sound_async("assets/double-pop-down.wav")
 
         except Exception as e:
             # Play failure sound
-            self.audio_manager._sound_pool.submit(self.play_sound, "assets/wrong-short.wav")
+            self.audio_manager.play_sound_async("assets/wrong-short.wav")
 
             print(f"Transcription error: An error occurred during transcription: {str(e)}")
             self.ui_manager.set_status("Error during transcription", "red")
@@ -1154,24 +1184,26 @@ class QuickWhisper(tk.Tk):
 
         except Exception as e:
             # Play failure sound
-            self.audio_manager._sound_pool.submit(self.play_sound, "assets/wrong-short.wav")
+            self.audio_manager.play_sound_async("assets/wrong-short.wav")
             messagebox.showerror("GPT Processing Error", f"An error occurred while processing with GPT: {e}")
             return None
         
 
     def resource_path(self, relative_path):
-        """Get the absolute path to the resource, works for both development and PyInstaller environments."""
-        try:
-            base_path = sys._MEIPASS
-        except AttributeError:
-            base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
-
-        # Handle icon files differently for Mac
-        if self.is_mac and relative_path.endswith('.ico'):
-            # Use .png version instead of .ico for Mac
-            relative_path = relative_path.replace('.ico', '.png')
+        """Get the absolute path to the resource, works for both development and PyInstaller environments.
 
-        abs_path = os.path.join(base_path, relative_path)
+        Results are memoised: the base directory never changes while the app runs, so each
+        asset path is only resolved once.
+        """
+        abs_path = self._resource_paths.get(relative_path)
+        if abs_path is None:
+            lookup_path = relative_path
+            # Handle icon files differently for Mac
+            if self.is_mac and lookup_path.endswith('.ico'):
+                # Use .png version instead of .ico for Mac (swap the extension only)
+                lookup_path = lookup_path[:-len('.ico')] + '.png'
+            abs_path = os.path.join(self._resource_base, lookup_path)
+            self._resource_paths[relative_path] = abs_path
         return abs_path
 
     def on_closing(self):
@@ -1202,6 +1234,9 @@ class QuickWhisper(tk.Tk):
         # Clean up audio
         self.audio_manager.cleanup()
 
+        # Drop any queued transcriptions; don't wait on one already uploading
+        self._work_pool.shutdown(wait=False, cancel_futures=True)
+
         self.destroy()
 
     def _get_valid_window_position(self, window_width, window_height, screen_width, screen_height):
@@ -1597,6 +1632,8 @@ class QuickWhisper(tk.Tk):
         button_height = get_button_height('dialog')
         corner_radius = button_height // 2
 
+        import customtkinter as ctk
+
         learn_more_btn = ctk.CTkButton(
             button_frame,
             text="Learn More on Our Website",
@@ -1702,6 +1739,16 @@ class QuickWhisper(tk.Tk):
         """Update the model label to include the prompt name and language setting."""
         self.ui_manager.update_model_label()
 
+    def apply_model_settings(self, transcription_model, transcription_model_type, ai_model, whisper_language):
+        """Apply saved model settings and refresh the model label once, only if anything changed."""
+        new_models = (transcription_model, transcription_model_type, ai_model, whisper_language)
+        if new_models == (self.transcription_model, self.transcription_model_type,
+                          self.ai_model, self.whisper_language):
+            return
+        (self.transcription_model, self.transcription_model_type,
+         self.ai_model, self.whisper_language) = new_models
+        self.update_model_label()
+
     def toggle_banner(self):
         """Toggle the visibility of the banner image."""
         self.ui_manager.toggle_banner()
@@ -1788,8 +1835,17 @@ class QuickWhisper(tk.Tk):
         ManagePromptsDialog(self)
 
     def open_config(self):
-        """Open the configuration dialog."""
-        ConfigDialog(self)
+        """Open the configuration dialog, reusing the previously built one when possible."""
+        dialog = getattr(self, '_config_dialog', None)
+        if dialog is not None and dialog.is_reusable():
+            dialog.reopen()
+            return
+        if dialog is not None:
+            try:
+                dialog.dialog.destroy()
+            except tk.TclError:
+                pass
+        self._config_dialog = ConfigDialog(self)
 
     def show_prompt_notification(self, message):
         """Show a temporary notification message in the status label and speak the prompt name."""
@@ -1997,6 +2053,7 @@ class QuickWhisper(tk.Tk):
                       f"streams_opened={audio['streams_opened']}  "
                       f"streams_closed={audio['streams_closed']}  "
                       f"frames_peak={audio['frames_peak']}  "
+                      f"overflows={audio['input_overflows']}  "
                       f"recordings={audio['recordings_started']}/{audio['recordings_stopped']}")
                 print(f"[MEMORY DIAG] threads: {thread_names}")
                 print(f"{'='*60}\n")
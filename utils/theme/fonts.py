@@ -123,6 +123,7 @@ class FontProvider:
     _is_hidpi = False
     _platform = None
     _size_map_key = 'base'
+    _font_cache = {}  # (size_name, weight) -> font tuple, valid until the next init()
 
     @classmethod
     def init(cls, is_hidpi: bool = False):
@@ -147,6 +148,7 @@ class FontProvider:
         else:
             cls._size_map_key = 'base'
 
+        cls._font_cache = {}
         cls._initialized = True
 
     @classmethod
@@ -185,13 +187,23 @@ class FontProvider:
         Returns:
             A tuple of (font_family, size) or (font_family, size, weight)
         """
+        # Every widget constructor asks for a font; hand back one shared tuple per spec
+        key = (size_name, weight)
+        font = cls._font_cache.get(key)
+        if font is not None:
+            return font
+
         family = cls.get_family()
         size = cls.get_size(size_name)
 
         if weight == 'normal':
-            return (family, size)
+            font = (family, size)
         else:
-            return (family, size, weight)
+            font = (family, size, weight)
+        # Before init() the family is only a fallback guess, so don't keep it
+        if cls._initialized:
+            cls._font_cache[key] = font
+        return font
 
     @classmethod
     def is_hidpi(cls) -> bool:
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-import customtkinter as ctk
 from PIL import Image, ImageTk, ImageDraw
 import platform
 import ctypes
@@ -1026,11 +1025,9 @@ class UIManager:
             else:
                 self.parent.selected_device.set(list(devices.keys())[0])
 
-            def on_device_change(*args):
-                config.selected_input_device = self.parent.selected_device.get()
-                config.save_settings()
-
-            self.parent.selected_device.trace_add("write", on_device_change)
+        # Registered even with no devices, so a device that shows up after
+        # refresh_input_devices() is still saved when picked
+        self.parent.selected_device.trace_add("write", self._on_device_change)
 
         # Device dropdown - ttk.Combobox with Sun Valley styling
         self.device_combo = ttk.Combobox(
@@ -1272,20 +1269,21 @@ class UIManager:
         self.banner_frame.pack(fill=tk.X)
         
         self.banner_height = 0
+        self.banner_photo = None
+        self.banner_label = None
         
         try:
-            banner_path = self.parent.resource_path("assets/banner-00-560.png")
-            banner_img = Image.open(banner_path)
-            self.banner_height = banner_img.height + 10
-            print(f"Banner image height: {banner_img.height}, total banner_height: {self.banner_height}")
-            self.banner_photo = ImageTk.PhotoImage(banner_img)
-            
-            self.banner_label = ttk.Label(self.banner_frame, image=self.banner_photo, cursor="hand2")
-            self.banner_label.pack(pady=(4, 6))
-            self.banner_label.bind("<Button-1>", lambda e: self.open_scorchsoft())
+            # Image.open only parses the PNG header, so reading the size is cheap
+            with Image.open(self.parent.resource_path("assets/banner-00-560.png")) as banner_img:
+                self.banner_height = banner_img.height + 10
+            print(f"Banner image height: {self.banner_height - 10}, total banner_height: {self.banner_height}")
         except Exception as e:
             print(f"Banner load error: {e}")
             self.banner_height = 260
+
+        # Skip decoding the banner when it starts hidden; toggle_banner loads it on first show
+        if not self.parent.hide_banner_on_load and self._ensure_banner_loaded():
+            self.banner_label.pack(pady=(4, 6))
         
         self.hide_banner_link = ttk.Label(
             self.banner_frame, text=_("Hide Banner"),
@@ -1305,6 +1303,31 @@ class UIManager:
         
         return self.main_frame
     
+    def _on_device_change(self, *args):
+        """Persist the selected input device (ignores the no-devices placeholder)."""
+        if not self._has_audio_devices:
+            return
+        config = get_config()
+        config.selected_input_device = self.parent.selected_device.get()
+        config.save_settings()
+
+    def refresh_input_devices(self):
+        """Re-enumerate audio input devices and update the device dropdown."""
+        devices = self.parent.audio_manager.refresh_input_devices()
+        self._has_audio_devices = bool(devices)
+        if not self.device_combo:
+            return
+
+        if devices:
+            names = list(devices.keys())
+            self.device_combo.configure(values=names, state="readonly")
+            if self.parent.selected_device.get() not in devices:
+                self.parent.selected_device.set(names[0])
+        else:
+            self.device_combo.configure(values=["No audio devices found"], state="disabled")
+            self.parent.selected_device.set("No audio devices found")
+        print(f"Refreshed audio input devices: {len(devices)} found")
+
     def _show_menu(self, menu_name):
         """Show menu dropdown."""
         menu_map = {
@@ -1321,6 +1344,20 @@ class UIManager:
     def open_scorchsoft(self, event=None):
         open_url('https://www.scorchsoft.com/')
         
+    def _ensure_banner_loaded(self):
+        """Decode the banner image and create its label if not done yet. Returns True if available."""
+        if self.banner_label is not None:
+            return True
+        try:
+            banner_path = self.parent.resource_path("assets/banner-00-560.png")
+            self.banner_photo = ImageTk.PhotoImage(Image.open(banner_path))
+            self.banner_label = ttk.Label(self.banner_frame, image=self.banner_photo, cursor="hand2")
+            self.banner_label.bind("<Button-1>", lambda e: self.open_scorchsoft())
+            return True
+        except Exception as e:
+            print(f"Banner load error: {e}")
+            return False
+
     def toggle_banner(self):
         # Check if window still exists before accessing winfo
         try:
@@ -1354,7 +1391,7 @@ class UIManager:
         else:
             # Showing banner - add back the height difference
             new_height = current_height + (banner_delta - link_height)
-            if self.banner_label:
+            if self._ensure_banner_loaded():
                 self.banner_label.pack(pady=(4, 6))
             self.powered_by_label.pack_forget()
             self.hide_banner_link.pack(pady=(4, 12))  # More padding for visibility